@@ -16,7 +16,8 @@ mkdir -p "$BUILD_DIR/usr/share/icons/hicolor/scalable/apps"
 mkdir -p "$BUILD_DIR/opt/turkamp"
 
 # Dosyaları kopyala
-cp turkamp.py "$BUILD_DIR/opt/turkamp/"
+cp -r turkamp turkamp_engine turkamp_worker.py "$BUILD_DIR/opt/turkamp/"
+rm -rf "$BUILD_DIR"/opt/turkamp/*/__pycache__
 cp turkamp.png "$BUILD_DIR/opt/turkamp/"
 cp turkamp.png "$BUILD_DIR/usr/share/icons/hicolor/scalable/apps/"
 
@@ -28,26 +29,45 @@ Section: utils
 Priority: optional
 Architecture: all
 Depends: python3, python3-pyqt6, python3-pyqt6.qtmultimedia
+Recommends: python3-numpy, ffmpeg
 Maintainer: mobilturka <https://github.com/03tekno/>
 Description: Turka Music Player
 EOF
 
-# Başlatıcı script (/usr/bin/turkamp)
+# Kurulumda bayt kodu bir kez derlenir; modül olarak çalıştırıldığı için her açılışta yeniden derlenmez
+cat <<EOF > "$BUILD_DIR/DEBIAN/postinst"
+#!/bin/sh
+set -e
+python3 -m compileall -q /opt/turkamp
+EOF
+cat <<EOF > "$BUILD_DIR/DEBIAN/prerm"
+#!/bin/sh
+set -e
+rm -rf /opt/turkamp/__pycache__ /opt/turkamp/turkamp/__pycache__ /opt/turkamp/turkamp_engine/__pycache__
+EOF
+chmod 755 "$BUILD_DIR/DEBIAN/postinst" "$BUILD_DIR/DEBIAN/prerm"
+
+# Başlatıcı script (/usr/bin/turkamp); dosya argümanları kullanıcının dizinine göre çözülsün diye cd yapılmaz
 cat <<EOF > "$BUILD_DIR/usr/bin/turkamp"
 #!/bin/bash
-cd /opt/turkamp
-python3 turkamp.py
+PYTHONPATH=/opt/turkamp exec python3 -m turkamp "\$@"
+EOF
+# Başsız çalma (pencere yok, yalnızca komut soketi): /usr/bin/turkampd
+cat <<EOF > "$BUILD_DIR/usr/bin/turkampd"
+#!/bin/bash
+PYTHONPATH=/opt/turkamp exec python3 -m turkamp_engine "\$@"
 EOF
-chmod +x "$BUILD_DIR/usr/bin/turkamp"
+chmod +x "$BUILD_DIR/usr/bin/turkamp" "$BUILD_DIR/usr/bin/turkampd"
 
 # Desktop dosyası
 cat <<EOF > "$BUILD_DIR/usr/share/applications/turkamp.desktop"
 [Desktop Entry]
 Name=TurkaMP
-Exec=/usr/bin/turkamp
+Exec=/usr/bin/turkamp %F
 Icon=turkamp
 Type=Application
 Categories=AudioVideo;Audio;Player;
+MimeType=audio/mpeg;audio/flac;audio/x-flac;audio/wav;audio/x-wav;audio/ogg;audio/opus;audio/mp4;audio/aac;audio/x-m4a;audio/x-mpegurl;audio/mpegurl;audio/x-scpls;
 EOF
 
 dpkg-deb --root-owner-group --build "$BUILD_DIR"
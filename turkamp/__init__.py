@@ -0,0 +1,1232 @@
+import sys
+import os
+import random
+import math
+import mmap
+import struct
+import time
+IMPORT_STARTED = time.perf_counter()
+import threading
+import hashlib
+import multiprocessing
+import queue
+import unicodedata
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from itertools import compress, filterfalse, repeat
+from operator import is_
+from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
+                             QHBoxLayout, QPushButton, QLabel, QFrame, QFileDialog, 
+                             QListView, QMenu, QLineEdit, QMessageBox)
+from PyQt6.QtCore import (Qt, QRect, QPointF, QTimer, pyqtSignal, QRectF, QLineF, # QRectF eklendi
+                          QObject, QAbstractProxyModel, QModelIndex, QEvent)
+from PyQt6.QtGui import QAction, QPainter, QColor, QLinearGradient, QPen, QFont, QFontMetrics, QIcon, QGuiApplication, QPolygonF, QPixmap, QPainterPath
+from PyQt6.QtMultimedia import QMediaPlayer
+try: from PyQt6.QtMultimedia import QAudioBufferOutput # Qt 6.8+
+except ImportError: QAudioBufferOutput = None
+import turkamp_engine
+from turkamp_engine import (PLAYLIST_FORMATS, SERVER_NAME, STARTUP, PROFILE, profiled, row_ranges, display_name, turkish_fold, format_duration,
+                            write_playlist, buffer_samples, PlayerEngine, CommandServer, send_to_running, argument_paths)
+from turkamp_worker import PEAK_MAGIC, PEAK_BUCKET, PEAK_FACTORS, peak_worker
+np = None # ilk boyamadan sonra load_numpy() ile yüklenir
+
+def load_numpy():
+    # Çekirdekle aynı numpy modülü; buffer_samples çekirdeğin kopyasını kullanır
+    global np
+    np = turkamp_engine.load_numpy(); return np
+
+PEAK_DIR = os.path.join(os.path.expanduser("~"), ".cache", "turkamp", "peaks")
+ICON_NAME = "turkamp.png" 
+
+@lru_cache(maxsize=None)
+def theme_styles(color, dark):
+    # 20 renk × koyu/açık için stil sayfaları bir kez üretilir; apply_theme_styles yalnızca hazır dizeleri dağıtır
+    if dark:
+        bg_style = "QMainWindow { background-color: #121212; }"; panel_bg = "#1e1e1e"; btn_grad = "stop:0 #333, stop:1 #1a1a1a"; shadow_light = "#2a2a2a"; shadow_dark = "#000000"; text_color = "#ffffff"; scroll_color = "#C0C0C0"
+    else:
+        bg_style = "QMainWindow { background-color: #e0e5ec; }"; panel_bg = "#e0e5ec"; btn_grad = "stop:0 #ffffff, stop:1 #d1d9e6"; shadow_light = "#ffffff"; shadow_dark = "#b8b9be"; text_color = "#333333"; scroll_color = "#000000"
+    btn_base = f"QPushButton {{ background: qlineargradient(x1:0, y1:0, x2:0, y2:1, {btn_grad}); border: 1px solid {shadow_light}; color: {text_color}; font-weight: bold; border-bottom: 4px solid {shadow_dark}; outline: none; }} QPushButton:hover {{ border-color: {color}; }} QPushButton:pressed {{ background: {shadow_dark}; border-bottom: 4px solid {shadow_dark}; }}"
+    rect_base = btn_base.replace("QPushButton {", "QPushButton { border-radius: 8px;")
+    return {
+        "window": bg_style,
+        "panels": f"QFrame#VolumePanel, QFrame#NavPanel {{ background-color: {panel_bg}; border-radius: 20px; border: 1px solid {shadow_light if dark else '#ffffff'}; border-bottom: 5px solid {shadow_dark}; border-right: 2px solid {shadow_dark}; }} QFrame#LCDContainer {{ background-color: #000; border-radius: 15px; border: 4px solid {color}; }}",
+        "round": btn_base.replace("QPushButton {", "QPushButton { border-radius: 19px;"),
+        "play": btn_base.replace("QPushButton {", "QPushButton { border-radius: 32px;"),
+        "rect": rect_base,
+        "rect_active": rect_base + f"QPushButton {{ color: {color}; border-color: {color}; }}",
+        "search": f"background: {panel_bg}; color: {text_color}; border: 2px solid {shadow_dark}; border-radius: 10px; padding: 5px;",
+        "list": f"QListView {{ background: {panel_bg}; color: {text_color}; border-radius: 15px; border: 2px solid {shadow_dark}; selection-background-color: {color}; padding: 5px; }} QScrollBar:vertical {{ border: none; background: transparent; width: 8px; }} QScrollBar::handle:vertical {{ background: {scroll_color}; border-radius: 4px; }}",
+        "time": f"color: {color}; font-family: 'Monospace'; font-size: 13px; font-weight: bold;",
+        "small": f"color: {text_color}; font-size: 11px;",
+    }
+
+TURKISH_ALPHABET = "abcçdefgğhıijklmnoöpqrsştuüvwxyz"
+TURKISH_COLLATION = str.maketrans({c: chr(0xE000 + i) for i, c in enumerate(TURKISH_ALPHABET)})
+SORT_COLUMNS = ("added", "name", "folder", "artist", "duration")
+
+def collation_key(text):
+    # Türkçe alfabe sırası (c < ç < d, g < ğ < h, ı < i, o < ö, s < ş, u < ü): harfler özel kullanım alanında sıralı
+    # kod noktalarına eşlenir, böylece karşılaştırma düz dize karşılaştırmasıdır. Diğer aksanlı harfler aksansız harfe
+    # indirgenir; rakam ve noktalama harflerden önce gelir
+    text = turkish_fold(text).translate(TURKISH_COLLATION)
+    if text.isascii(): return text
+    text = "".join(c for c in unicodedata.normalize("NFD", text) if not unicodedata.combining(c))
+    return text.translate(TURKISH_COLLATION)
+
+def bisect_after(keys, key, lo, descending):
+    # Sıralı (azalan ya da artan) dizide eşit anahtarlardan sonraki yer
+    if not descending: return bisect_right(keys, key, lo)
+    hi = len(keys)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if keys[mid] < key: hi = mid
+        else: lo = mid + 1
+    return lo
+
+class SortKeys(QObject):
+    # Sütun başına yol -> derleme anahtarı önbelleği. Anahtarlar arka plan iş parçacığında üretilir (100 bin yolda saniyeler);
+    # önbelleğe GUI iş parçacığında yazılır ve keysReady ile bildirilir. Her istek bir numara taşır: etiketi değişen yol
+    # yeniden istendiğinde eski hesap gelirse atılır. Etiketi gelen yolun eski anahtarı yenisi gelene kadar kullanılır
+    keysReady = pyqtSignal(str, list)
+    rawKeys = pyqtSignal(str, int, list, list)
+    slice_size = 10000
+
+    def __init__(self, metadata, parent=None):
+        super().__init__(parent)
+        self.metadata = metadata; self.cache = {column: {} for column in SORT_COLUMNS}; self.pending = {column: {} for column in SORT_COLUMNS}
+        self.token = 0; self.queue = queue.Queue(); self.thread = None
+        self.rawKeys.connect(self.deliver) # GUI iş parçacığında çalışır
+
+    def request(self, column, paths, force=False):
+        cache = self.cache[column]; pending = self.pending[column]
+        paths = [p for p in paths if force or (p not in cache and p not in pending)]
+        if not paths: return
+        self.token += 1
+        for path in paths: pending[path] = self.token
+        self.queue.put((column, self.token, paths))
+        if self.thread is None: self.thread = threading.Thread(target=self.run, daemon=True); self.thread.start()
+
+    def refresh(self, column, paths):
+        # Etiketi değişen yollar: gösterilen sütunda yeniden hesaplanır, diğer etikete bağlı sütunlarda düşürülür
+        for name in ("name", "artist", "duration"): # klasör anahtarı etiketlere bağlı değil
+            cache = self.cache[name]; pending = self.pending[name]
+            if name == column: self.request(name, [p for p in paths if p in cache or p in pending], force=True); continue
+            for path in paths: cache.pop(path, None); pending.pop(path, None)
+
+    def stop(self):
+        if self.thread is not None: self.queue.put(None)
+
+    def run(self):
+        while True:
+            job = self.queue.get()
+            if job is None: return
+            column, token, paths = job; make = getattr(self, "key_" + column)
+            for i in range(0, len(paths), self.slice_size):
+                part = paths[i:i + self.slice_size]; self.rawKeys.emit(column, token, part, [make(p) for p in part])
+
+    def deliver(self, column, token, paths, keys):
+        cache = self.cache[column]; pending = self.pending[column]; ready = []
+        for path, key in zip(paths, keys):
+            if pending.get(path) == token: del pending[path]; cache[path] = key; ready.append(path)
+        if ready: self.keysReady.emit(column, ready)
+
+    def key_name(self, path): return collation_key(display_name(path, self.metadata.get(path)))
+
+    def key_folder(self, path):
+        folder, name = os.path.split(path)
+        return collation_key(folder) + "\0" + collation_key(name)
+
+    def key_artist(self, path):
+        # Sanatçı, albüm, başlık; sanatçısı bilinmeyenler sona
+        info = self.metadata.get(path) or {}; artist = info.get("artist")
+        return (collation_key(artist) if artist else "\uffff") + "\0" + collation_key(info.get("album") or "") + "\0" + collation_key(info.get("title") or os.path.basename(path))
+
+    def key_duration(self, path):
+        info = self.metadata.get(path)
+        return (info.get("duration") or math.inf) if info else math.inf
+
+class PlaylistProxy(QAbstractProxyModel):
+    # Arama süzgeci ve sıralama tek bir eşlemede: rows[görünüm satırı] = kaynak satırı. Kaynak satırları (geçerli parça,
+    # çalma sırası, current_index) hiç yer değiştirmez. Tam sıra (full) anahtarı hazır satırların sorted() sırası + anahtarı
+    # beklenenler (ekleme sırasıyla); gelen anahtarlar yeniden sıralamadan birleştirilir. Süzgeç tam sırayı yeniden kullanır;
+    # süzgeç ve sıra değişimleri layoutChanged ile yayılır, geçerli satır ve seçim kalıcı indekslerle korunur
+    def __init__(self, keys, parent=None):
+        super().__init__(parent)
+        self.keys = keys; self.allowed = None; self.column = "added"; self.descending = False
+        self.rows = []; self.where = None; self.full = None; self.order_keys = []; self.ranked = None; self.removing = False; self.ready = set(); self.waits = 0
+        self.merge_timer = QTimer(self); self.merge_timer.setSingleShot(True); self.merge_timer.setInterval(200); self.merge_timer.timeout.connect(self.merge)
+        keys.keysReady.connect(self.keys_ready)
+
+    def setSourceModel(self, model):
+        self.beginResetModel(); super().setSourceModel(model)
+        model.rowsInserted.connect(self.source_inserted); model.rowsAboutToBeRemoved.connect(self.source_removing); model.rowsRemoved.connect(self.source_removed)
+        model.modelAboutToBeReset.connect(self.beginResetModel); model.modelReset.connect(self.source_reset); model.dataChanged.connect(self.source_changed)
+        self.rows = self.arrange(); self.index_rows(); self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()): return 0 if parent.isValid() else len(self.rows)
+    def columnCount(self, parent=QModelIndex()): return 0 if parent.isValid() else 1
+
+    def index(self, row, column=0, parent=QModelIndex()):
+        return self.createIndex(row, column) if not parent.isValid() and column == 0 and 0 <= row < len(self.rows) else QModelIndex()
+
+    def parent(self, index=None): return QModelIndex() # düz liste
+
+    def mapToSource(self, index):
+        return self.sourceModel().index(self.rows[index.row()]) if index.isValid() and index.row() < len(self.rows) else QModelIndex()
+
+    def mapFromSource(self, index): return self.index(self.proxy_row(index.row())) if index.isValid() else QModelIndex()
+
+    def proxy_row(self, row):
+        if self.where is None: return row if 0 <= row < len(self.rows) else -1
+        return self.where.get(row, -1)
+
+    def natural(self): return self.column == "added" and not self.descending
+
+    def sort_order(self, paths):
+        # (tam sıra, sıralı önekin anahtarları): anahtarı hazır satırlar tek bir sorted() ile, anahtarı beklenenler sonda
+        if self.column == "added": return list(range(len(paths) - 1, -1, -1) if self.descending else range(len(paths))), []
+        keys = list(map(self.keys.cache[self.column].get, paths)); missing = list(map(is_, keys, repeat(None)))
+        order = sorted(filterfalse(missing.__getitem__, range(len(paths))), key=keys.__getitem__, reverse=self.descending)
+        tail = list(compress(range(len(paths)), missing))
+        if tail: self.keys.request(self.column, list(compress(paths, missing)))
+        return order + tail, list(map(keys.__getitem__, order))
+
+    def arrange(self):
+        paths = self.sourceModel().paths
+        if self.full is None: self.full, self.order_keys = self.sort_order(paths); self.ranked = None
+        if self.allowed is None: return list(self.full)
+        allowed = self.allowed
+        return [r for r in self.full if paths[r] in allowed]
+
+    def index_rows(self): self.where = None if self.natural() and self.allowed is None else dict(zip(self.rows, range(len(self.rows))))
+
+    def sequence(self):
+        # Karıştırma kapalıyken çalma sırası görünümün sırasını izler (süzgeçten bağımsız, tüm liste)
+        if self.natural(): return None
+        if self.full is None: self.full, self.order_keys = self.sort_order(self.sourceModel().paths)
+        if self.ranked is None: self.ranked = (self.full, {r: i for i, r in enumerate(self.full)})
+        return self.ranked
+
+    def relayout(self):
+        self.layoutAboutToBeChanged.emit()
+        persistent = self.persistentIndexList(); sources = [self.rows[i.row()] if i.isValid() and i.row() < len(self.rows) else -1 for i in persistent]
+        self.rows = self.arrange(); self.index_rows()
+        self.changePersistentIndexList(persistent, [self.index(self.proxy_row(r)) if r >= 0 else QModelIndex() for r in sources])
+        self.layoutChanged.emit()
+
+    def set_allowed(self, allowed): self.allowed = allowed; self.relayout()
+
+    def sort_by(self, column, descending=False):
+        self.column = column if column in SORT_COLUMNS else "added"; self.descending = bool(descending)
+        self.full = None; self.ready.clear(); self.waits = 0; self.merge_timer.stop(); self.relayout()
+
+    def settled(self): return self.column == "added" or not (self.keys.pending[self.column] or self.ready)
+
+    def refresh_keys(self, paths):
+        # Etiketi gelen yollar: gösterilen sütunun anahtarları arka planda yenilenir, gelince yerlerine birleştirilir
+        self.keys.refresh(self.column, paths)
+
+    def keys_ready(self, column, paths):
+        if column != self.column or self.full is None: return
+        self.ready.update(paths)
+        if not self.merge_timer.isActive(): self.merge_timer.start() # tarama parçaları ve etiket dalgaları tek birleştirmede
+
+    def merge(self):
+        # Kuyruktan anahtarı gelen yeni satırlar kendi aralarında sıralanıp önekteki yerlerine ikili aramayla, önek
+        # dilimlenerek eklenir (100 binlik listeye bir tarama parçası birkaç ms). Öneki etkileyen (etiketi değişen) ya da
+        # önekle kıyaslanacak kadar büyük gelişlerde önbellekteki anahtarlarla tek sorted() yapılır. Anahtar üretimi
+        # sürerken birleştirme en çok ~1 sn ertelenir: toplu sıralama tek seferde, tarama düzenli aralıklarla birleşir
+        if self.keys.pending[self.column] and self.waits < 5: self.waits += 1; self.merge_timer.start(); return
+        ready = self.ready; self.ready = set(); self.waits = 0
+        if not ready or self.full is None or self.column == "added": return
+        paths = self.sourceModel().paths; okeys = self.order_keys; split = len(okeys); tail = self.full[split:]
+        fresh = list(map(ready.__contains__, map(paths.__getitem__, tail))); arrived = list(compress(tail, fresh))
+        if len(arrived) < len(ready) or len(arrived) * 16 > split: self.full, self.order_keys = self.sort_order(paths)
+        else:
+            cache = self.keys.cache[self.column]; keys = [cache[paths[r]] for r in arrived]; desc = self.descending
+            rows = self.full[:split]; full = []; order_keys = []; lo = 0
+            for i in sorted(range(len(arrived)), key=keys.__getitem__, reverse=desc):
+                key = keys[i]; at = bisect_after(okeys, key, lo, desc)
+                full += rows[lo:at]; order_keys += okeys[lo:at]; full.append(arrived[i]); order_keys.append(key); lo = at
+            self.full = full + rows[lo:] + [r for r, f in zip(tail, fresh) if not f]; self.order_keys = order_keys + okeys[lo:]
+        self.ranked = None; self.relayout()
+
+    def source_inserted(self, parent, first, last):
+        count = last - first + 1; paths = self.sourceModel().paths; self.ranked = None
+        new = [r for r in range(first, last + 1) if self.allowed is None or paths[r] in self.allowed]
+        if first < len(paths) - count:
+            self.rows = [r + count if r >= first else r for r in self.rows] # görünüm satırları aynı kalır
+            if self.full is not None: self.full = [r + count if r >= first else r for r in self.full]
+        # Sırasız görünümde kaynak sırasındaki yerine, sıralıda sona eklenir; anahtarları gelince yerlerine birleştirilir
+        if self.column == "added": self.full = None
+        elif self.full is not None:
+            added = [paths[r] for r in range(first, last + 1)]; self.full += range(first, last + 1)
+            self.keys.request(self.column, added); cache = self.keys.cache[self.column]; known = [p for p in added if p in cache]
+            if known: self.keys_ready(self.column, known)
+        pos = bisect_left(self.rows, first) if self.natural() else len(self.rows)
+        if new: self.beginInsertRows(QModelIndex(), pos, pos + len(new) - 1); self.rows[pos:pos] = new; self.index_rows(); self.endInsertRows()
+        else: self.index_rows()
+        if new and self.column == "added" and self.descending: self.relayout() # en yeni en üstte
+
+    def source_removing(self, parent, first, last):
+        self.removing = True; gone = [i for i in map(self.proxy_row, range(first, last + 1)) if i >= 0]
+        for a, b in reversed(list(row_ranges(gone))): self.beginRemoveRows(QModelIndex(), a, b); del self.rows[a:b + 1]; self.endRemoveRows()
+
+    def source_removed(self, parent, first, last):
+        count = last - first + 1; self.ranked = None; self.removing = False
+        self.rows = [r - count if r > last else r for r in self.rows]; self.index_rows()
+        if self.full is not None:
+            kept = [not first <= r <= last for r in self.full]; self.order_keys = list(compress(self.order_keys, kept))
+            self.full = [r - count if r > last else r for r in compress(self.full, kept)]
+
+    def source_reset(self): self.full = None; self.ready.clear(); self.rows = self.arrange(); self.index_rows(); self.endResetModel()
+
+    def source_changed(self, top, bottom, roles=()):
+        if self.rows: self.dataChanged.emit(self.index(0), self.index(len(self.rows) - 1), list(roles))
+
+class SearchIndex:
+    # Katlanmış dosya adı + etiket metinleri tek bir derlem dizesinde tutulur; tarama C düzeyinde str.find ile yapılır.
+    # Önceki sorguyu içeren (daraltan) sorgular yalnızca önceki sonuç kümesinde süzülür.
+    def __init__(self, model, metadata):
+        self.model = model; self.metadata = metadata; self.texts = {}
+        self.corpus = None; self.starts = []; self.entries = []; self.last_query = None; self.last_result = None
+
+    def invalidate(self, paths=None):
+        for path in paths or (): self.texts.pop(path, None)
+        self.corpus = None; self.last_query = None; self.last_result = None
+
+    def text(self, path):
+        text = self.texts.get(path)
+        if text is None:
+            info = self.metadata.get(path) or {}
+            fields = [os.path.basename(path)] + [info.get(key) or "" for key in ("artist", "title", "album")]
+            text = self.texts[path] = turkish_fold(" ".join(fields).replace("\n", " "))
+        return text
+
+    def build(self):
+        self.entries = list(dict.fromkeys(self.model.paths)); parts = [self.text(path) for path in self.entries]
+        self.starts = []; pos = 0
+        for part in parts: self.starts.append(pos); pos += len(part) + 1
+        self.corpus = "\n".join(parts)
+
+    def search(self, query):
+        q = turkish_fold(query.strip())
+        if not q: self.last_query = self.last_result = None; return None
+        tokens = sorted(q.split(), key=len, reverse=True)
+        if self.last_result is not None and self.last_query in q: candidates = self.last_result
+        else:
+            if self.corpus is None: self.build()
+            candidates = []; corpus = self.corpus; starts = self.starts; pos = corpus.find(tokens[0])
+            while pos >= 0:
+                i = bisect_right(starts, pos) - 1; candidates.append(self.entries[i])
+                if i + 1 >= len(starts): break
+                pos = corpus.find(tokens[0], starts[i + 1])
+        texts = self.texts
+        result = {path for path in candidates if all(token in texts[path] for token in tokens)}
+        self.last_query = q; self.last_result = result
+        return result
+
+class DragDropList(QListView):
+    fileDropped = pyqtSignal(list)
+    deleteRequested = pyqtSignal()
+    playNextRequested = pyqtSignal()
+    clearRequested = pyqtSignal()
+    cancelScanRequested = pyqtSignal()
+    addLibraryRequested = pyqtSignal()
+    findDuplicatesRequested = pyqtSignal()
+    exportRequested = pyqtSignal()
+    loudnessRequested = pyqtSignal(str) # start / pause / resume / stop
+    normalizeToggled = pyqtSignal(bool)
+    removeLibraryRequested = pyqtSignal(str)
+    sortRequested = pyqtSignal(str, bool) # sütun, azalan
+    rowActivated = pyqtSignal(int)
+    sort_labels = {"added": "Eklenme Sırası", "name": "Ad", "folder": "Klasör", "artist": "Sanatçı / Albüm", "duration": "Süre"}
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setAcceptDrops(True)
+        self.setUniformItemSizes(True); self.setLayoutMode(QListView.LayoutMode.Batched); self.setBatchSize(500)
+        self.setEditTriggers(QListView.EditTrigger.NoEditTriggers)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        self.customContextMenuRequested.connect(self.show_context_menu)
+        self.doubleClicked.connect(lambda index: self.rowActivated.emit(self.source_row(index)))
+        self.scan_active = False; self.hidden_row = -1; self.library_roots = []; self.loudness_state = "idle"; self.normalize = True; self.sort_state = ("added", False)
+
+    def source_model(self):
+        model = self.model()
+        return model.sourceModel() if isinstance(model, QAbstractProxyModel) else model
+
+    def source_row(self, index):
+        model = self.model()
+        return (model.mapToSource(index) if isinstance(model, QAbstractProxyModel) else index).row()
+
+    def view_index(self, row):
+        model = self.model(); index = self.source_model().index(row, 0)
+        return model.mapFromSource(index) if isinstance(model, QAbstractProxyModel) else index
+
+    def count(self): return self.source_model().rowCount() if self.model() else 0
+
+    def currentRow(self):
+        # Satırlar kaynak modelin satırlarıdır; filtrede gizli kalan geçerli satır ayrıca hatırlanır
+        index = self.currentIndex()
+        if index.isValid(): return self.source_row(index)
+        return self.hidden_row if self.hidden_row < self.count() else -1
+
+    def setCurrentRow(self, row):
+        if not 0 <= row < self.count(): return
+        index = self.view_index(row); self.hidden_row = -1 if index.isValid() else row
+        self.setCurrentIndex(index)
+
+    def selected_rows(self): return sorted(self.source_row(index) for index in self.selectionModel().selectedIndexes())
+
+    def keyPressEvent(self, event):
+        if event.key() == Qt.Key.Key_Escape and self.scan_active: self.cancelScanRequested.emit()
+        else: super().keyPressEvent(event)
+
+    def dragEnterEvent(self, event):
+        if event.mimeData().hasUrls(): event.accept()
+        else: event.ignore()
+
+    def dragMoveEvent(self, event):
+        if event.mimeData().hasUrls(): event.accept()
+        else: event.ignore()
+
+    def dropEvent(self, event):
+        files = [u.toLocalFile() for u in event.mimeData().urls()]
+        self.fileDropped.emit(files)
+
+    def show_context_menu(self, position):
+        menu = QMenu(self)
+        menu.setStyleSheet("QMenu { background-color: #2c3e50; color: white; border: 1px solid #7f8c8d; } QMenu::item:selected { background-color: #34495e; }")
+        remove_action = QAction("Parçayı Sil", self)
+        remove_action.triggered.connect(lambda: self.deleteRequested.emit())
+        clear_action = QAction("Tümünü Sil", self)
+        clear_action.triggered.connect(lambda: self.clearRequested.emit())
+        next_action = QAction("Sıradaki Olarak Çal", self)
+        next_action.triggered.connect(lambda: self.playNextRequested.emit())
+        if self.indexAt(position).isValid(): menu.addAction(next_action); menu.addAction(remove_action)
+        menu.addAction(clear_action)
+        column, descending = self.sort_state; order = menu.addMenu("Sırala")
+        for key, label in self.sort_labels.items():
+            action = order.addAction(label); action.setCheckable(True); action.setChecked(key == column)
+            action.triggered.connect(lambda checked=False, k=key: self.sortRequested.emit(k, descending))
+        order.addSeparator(); reverse = order.addAction("Azalan"); reverse.setCheckable(True); reverse.setChecked(descending)
+        reverse.toggled.connect(lambda checked: self.sortRequested.emit(column, checked))
+        export_action = QAction("Listeyi Dışa Aktar…", self); export_action.triggered.connect(lambda: self.exportRequested.emit()); menu.addAction(export_action)
+        duplicates_action = QAction("Kopyaları Bul", self); duplicates_action.triggered.connect(lambda: self.findDuplicatesRequested.emit()); menu.addAction(duplicates_action)
+        loudness = menu.addMenu("Ses Düzeyi")
+        normalize_action = loudness.addAction("Parçalar Arasında Eşitle"); normalize_action.setCheckable(True); normalize_action.setChecked(self.normalize)
+        normalize_action.toggled.connect(lambda checked: self.normalizeToggled.emit(checked))
+        for label, command in {"idle": [("Analizi Başlat", "start")], "running": [("Analizi Duraklat", "pause"), ("Analizi Durdur", "stop")],
+                               "paused": [("Analizi Sürdür", "resume"), ("Analizi Durdur", "stop")]}[self.loudness_state]:
+            loudness.addAction(label).triggered.connect(lambda checked=False, c=command: self.loudnessRequested.emit(c))
+        library_action = QAction("Kütüphane Klasörü Ekle…", self); library_action.triggered.connect(lambda: self.addLibraryRequested.emit()); menu.addAction(library_action)
+        if self.library_roots:
+            watched = menu.addMenu("İzlemeyi Bırak")
+            for root in self.library_roots: watched.addAction(root).triggered.connect(lambda checked=False, r=root: self.removeLibraryRequested.emit(r))
+        if self.scan_active:
+            cancel_action = QAction("Taramayı İptal Et", self); cancel_action.triggered.connect(lambda: self.cancelScanRequested.emit()); menu.addAction(cancel_action)
+        menu.exec(self.mapToGlobal(position))
+
+class FrameScheduler(QObject):
+    # Tüm animasyonlar tek zamanlayıcıdan beslenir; canlandırılacak bir şey yoksa ya da pencere görünmüyorsa tik durur
+    def __init__(self, fps=33, parent=None):
+        super().__init__(parent)
+        self.clients = []; self.window = None; self.watching = False; self.last = time.monotonic()
+        self.timer = QTimer(self); self.timer.setTimerType(Qt.TimerType.PreciseTimer); self.timer.timeout.connect(self.tick); self.set_fps(fps)
+
+    def set_fps(self, fps): self.fps = max(1, min(240, int(fps))); self.timer.setInterval(round(1000 / self.fps))
+
+    def add(self, wants_frames, advance, wake_signal=None):
+        self.clients.append((wants_frames, advance))
+        if wake_signal is not None: wake_signal.connect(self.wake)
+
+    def watch(self, window):
+        # Küçültme/geri getirme ve (destekleyen platformlarda) örtülme değişimlerinde uyan
+        self.window = window; handle = window.windowHandle()
+        if handle is None or self.watching: return
+        self.watching = True; handle.installEventFilter(self); handle.visibilityChanged.connect(lambda visibility: self.wake())
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Type.Expose: self.wake()
+        return False
+
+    def window_visible(self):
+        if self.window is None: return True
+        handle = self.window.windowHandle()
+        return self.window.isVisible() and not self.window.isMinimized() and (handle is None or handle.isExposed())
+
+    def wake(self):
+        if not self.timer.isActive(): self.last = time.monotonic(); self.timer.start()
+
+    def tick(self):
+        now = time.monotonic(); dt = min(now - self.last, 0.25); self.last = now
+        if not self.window_visible(): self.timer.stop(); return
+        busy = False
+        for wants_frames, advance in self.clients:
+            if wants_frames(): advance(dt); busy = True
+        if not busy: self.timer.stop()
+
+class ScrollingLabel(QWidget):
+    animationNeeded = pyqtSignal()
+    speed = 33 # piksel/sn
+
+    def __init__(self, text="", parent=None):
+        super().__init__(parent)
+        self.full_text = ""; self.text_width = 0; self.offset = 0.0; self.space_gap = 150; self.setFixedHeight(35)
+        self.text_font = QFont("DejaVu Sans", 11, QFont.Weight.Bold); self.metrics = QFontMetrics(self.text_font); self.text_color = QColor("#FFFFFF")
+        self.cache_key = None; self.cache = None; self.running = False
+        self.setText(text)
+
+    def setText(self, text):
+        self.full_text = str(text); self.text_width = self.metrics.horizontalAdvance(self.full_text); self.offset = 0.0; self.update()
+        self.animationNeeded.emit()
+
+    def setColor(self, color): self.text_color = QColor(color); self.update()
+
+    def set_running(self, running):
+        # Yalnızca çalarken kayar; durdurulmuş ya da duraklatılmış oynatıcıda başlık yerinde kalır ve tik istemez
+        if running != self.running: self.running = running; self.animationNeeded.emit()
+
+    def scrolling(self): return self.text_width > self.width()
+
+    def wants_frames(self): return self.running and bool(self.full_text) and self.isVisible() and self.scrolling()
+
+    def advance(self, dt):
+        self.offset -= self.speed * dt
+        if abs(self.offset) >= (self.text_width + self.space_gap): self.offset = 0.0
+        self.update()
+
+    def resizeEvent(self, event): super().resizeEvent(event); self.animationNeeded.emit()
+    def showEvent(self, event): super().showEvent(event); self.animationNeeded.emit()
+
+    def text_pixmap(self):
+        # Başlık bir kez pixmap'e çizilir; metin, yazı tipi, renk ya da boyut değişmedikçe her kare yalnızca kopyalanır
+        dpr = self.devicePixelRatioF()
+        key = (self.full_text, self.text_font.key(), self.text_color.rgba(), self.height(), dpr)
+        if key == self.cache_key: return self.cache
+        pixmap = QPixmap(max(1, round((self.text_width + 2) * dpr)), max(1, round(self.height() * dpr)))
+        pixmap.setDevicePixelRatio(dpr); pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap); painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(self.text_color); painter.setFont(self.text_font)
+        painter.drawText(0, (self.height() + self.metrics.ascent() - self.metrics.descent()) // 2, self.full_text); painter.end()
+        self.cache_key = key; self.cache = pixmap
+        return pixmap
+
+    @profiled("ScrollingLabel.paintEvent")
+    def paintEvent(self, event):
+        if not self.full_text: return
+        pixmap = self.text_pixmap(); painter = QPainter(self)
+        if not self.scrolling(): painter.drawPixmap(0, 0, pixmap); return
+        painter.drawPixmap(int(self.offset), 0, pixmap)
+        painter.drawPixmap(int(self.offset) + self.text_width + self.space_gap, 0, pixmap)
+
+class WaveformSeekBar(QWidget):
+    # Konum çubuğu: tepe dizilerinden çizilen dalga biçimi, çalınan kısım tema renginde. Dalga biçimi yalnızca veri,
+    # boyut ya da renk değişince iki pixmap'e çizilir; konum değişimlerinde bu katmanlar kırpılarak kopyalanır
+    sliderMoved = pyqtSignal(int)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setFixedHeight(26); self.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.maximum = 0; self.value = 0; self.levels = None; self.version = 0; self.color = QColor("#00e676"); self.layer_key = None; self.layers = None
+
+    def setRange(self, low, high): self.maximum = max(0, high); self.update()
+
+    def setValue(self, value):
+        if value != self.value: self.value = value; self.update()
+
+    def setColor(self, color): self.color = QColor(color); self.update()
+
+    def set_peaks(self, levels): self.levels = levels; self.version += 1; self.update()
+
+    def seek(self, x):
+        if self.maximum <= 0: return
+        value = int(max(0.0, min(1.0, x / max(1, self.width()))) * self.maximum); self.setValue(value); self.sliderMoved.emit(value)
+
+    def mousePressEvent(self, event): self.seek(event.position().x())
+
+    def mouseMoveEvent(self, event):
+        if event.buttons() & Qt.MouseButton.LeftButton: self.seek(event.position().x())
+
+    def columns(self, width):
+        # Piksel sütunu başına (min, max): sütun başına en az bir kova veren en kaba düzey seçilir
+        per_column = self.maximum / 1000 / width
+        seconds, pairs = next((level for level in reversed(self.levels) if level[0] <= per_column), self.levels[0])
+        starts = (np.arange(width) * (per_column / seconds)).astype(np.int64); visible = starts < len(pairs)
+        if not visible.any(): return None
+        starts = starts[visible]
+        return np.nonzero(visible)[0], np.minimum.reduceat(pairs[:, 0], starts), np.maximum.reduceat(pairs[:, 1], starts)
+
+    def waveform_layers(self):
+        dpr = self.devicePixelRatioF(); key = (self.version, self.maximum, self.width(), self.height(), dpr, self.color.rgba())
+        if key == self.layer_key: return self.layers
+        self.layer_key = key; self.layers = None
+        if not self.levels or self.maximum <= 0 or not np: return None
+        columns = self.columns(self.width())
+        if columns is None: return None
+        mid = self.height() / 2; scale = (mid - 1) / 127
+        lines = [QLineF(x + 0.5, mid - hi * scale, x + 0.5, mid - lo * scale + 1) for x, lo, hi in zip(*(a.tolist() for a in columns))]
+        self.layers = []
+        for color in (self.color, QColor(110, 110, 110)):
+            pixmap = QPixmap(max(1, round(self.width() * dpr)), max(1, round(self.height() * dpr))); pixmap.setDevicePixelRatio(dpr); pixmap.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(pixmap); painter.setPen(color); painter.drawLines(lines); painter.end(); self.layers.append(pixmap)
+        return self.layers
+
+    def paintEvent(self, event):
+        painter = QPainter(self); w, h = self.width(), self.height()
+        x = round(self.value / self.maximum * w) if self.maximum > 0 else 0
+        layers = self.waveform_layers()
+        if layers is None: # dalga biçimi henüz yok: ince oluk
+            painter.fillRect(QRectF(0, h / 2 - 3, w, 6), QColor("#111111")); painter.fillRect(QRectF(0, h / 2 - 3, x, 6), self.color); return
+        painter.setClipRect(0, 0, x, h); painter.drawPixmap(0, 0, layers[0])
+        painter.setClipRect(x, 0, w - x, h); painter.drawPixmap(0, 0, layers[1])
+        painter.setClipping(False); painter.fillRect(QRectF(x - 1, 0, 2, h), self.color)
+
+class ProVolumeKnob(QWidget):
+    valueChanged = pyqtSignal(int)
+    valueCommitted = pyqtSignal(int) # sürükleme bitti
+    radius = 36
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setFixedSize(120, 120); self.value = 75; self.color = QColor("#00e676"); self.is_dark = True; self.setCursor(Qt.CursorShape.PointingHandCursor)
+        # Çentik geometrisi bir kez hesaplanır (boyut sabit)
+        center = QPointF(self.rect().center()); self.ticks = []
+        for i in range(21):
+            rad = math.radians(135 + (i * 13.5))
+            self.ticks.append(QLineF(center.x() + (self.radius + 10) * math.cos(rad), center.y() + (self.radius + 10) * math.sin(rad),
+                                     center.x() + (self.radius + 18) * math.cos(rad), center.y() + (self.radius + 18) * math.sin(rad)))
+        self.body_rect = QRectF(0, 0, self.radius*2, self.radius*2); self.body_rect.moveCenter(center)
+        self.layer_key = None; self.layer = None; self.value_font = QFont("sans-serif", 10, QFont.Weight.Bold)
+    def setValue(self, val): self.value = max(0, min(100, val)); self.update()
+    def mouseMoveEvent(self, event):
+        center = QPointF(self.width() / 2, self.height() / 2); pos = event.position()
+        angle = math.degrees(math.atan2(center.y() - pos.y(), pos.x() - center.x()))
+        adj = (angle + 225) % 360
+        if adj > 270: adj = 270
+        val = int((adj / 270) * 100)
+        if abs(val - self.value) < 35: self.value = val; self.valueChanged.emit(self.value); self.update()
+    def mouseReleaseEvent(self, event): self.valueCommitted.emit(self.value)
+    def static_layer(self):
+        # Gölge, gövde gradyanı ve pasif çentikler tema/mod başına bir kez pixmap'e çizilir
+        dpr = self.devicePixelRatioF(); key = (self.color.rgba(), self.is_dark, dpr)
+        if key == self.layer_key: return self.layer
+        self.layer = QPixmap(round(self.width() * dpr), round(self.height() * dpr)); self.layer.setDevicePixelRatio(dpr); self.layer.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(self.layer); painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        pen = QPen(QColor(100, 100, 100, 100)); pen.setCapStyle(Qt.PenCapStyle.RoundCap); pen.setWidth(3); painter.setPen(pen); painter.drawLines(self.ticks)
+        rect_f = self.body_rect
+        painter.setBrush(QColor(0,0,0,100)); painter.setPen(Qt.PenStyle.NoPen); painter.drawEllipse(rect_f.translated(2, 4))
+        grad = QLinearGradient(rect_f.topLeft(), rect_f.bottomRight())
+        if self.is_dark: grad.setColorAt(0, QColor("#454545")); grad.setColorAt(1, QColor("#1a1a1a"))
+        else: grad.setColorAt(0, QColor("#ffffff")); grad.setColorAt(1, QColor("#d1d9e6"))
+        painter.setBrush(grad); painter.setPen(QPen(QColor(0,0,0,180) if self.is_dark else QColor(180,180,180), 1)); painter.drawEllipse(rect_f); painter.end()
+        self.layer_key = key
+        return self.layer
+    @profiled("ProVolumeKnob.paintEvent")
+    def paintEvent(self, event):
+        layer = self.static_layer()
+        painter = QPainter(self); painter.drawPixmap(0, 0, layer); painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        center = self.body_rect.center(); radius = self.radius; pen = QPen(self.color); pen.setCapStyle(Qt.PenCapStyle.RoundCap); pen.setWidth(3)
+        active = self.value // 5 + 1
+        painter.setPen(pen); painter.drawLines(self.ticks[:active])
+        painter.setBrush(self.color); painter.setPen(QPen(QColor(0,0,0,180) if self.is_dark else QColor(180,180,180), 1))
+        v_ang = math.radians(135 + (self.value * 2.7)); ind_r = radius - 10
+        painter.drawEllipse(QPointF(center.x() + ind_r * math.cos(v_ang), center.y() + ind_r * math.sin(v_ang)), 3, 3)
+        painter.setPen(QColor("#FFFFFF") if self.is_dark else QColor("#2d3436")); painter.setFont(self.value_font); painter.drawText(self.body_rect, Qt.AlignmentFlag.AlignCenter, f"{self.value}")
+
+def load_peaks(target):
+    # Dosya mmap ile açılır, düzeyler kopyasız numpy görünümleri olarak döner: [(kova süresi sn, (n, 2) int8)] ince → kaba
+    try:
+        with open(target, "rb") as f: mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, rate, bucket, count = struct.unpack_from("<4sIII", mm)
+        if magic != PEAK_MAGIC or not rate: return None
+        levels = []; offset = 16 + 8 * count
+        for i in range(count):
+            factor, n = struct.unpack_from("<II", mm, 16 + 8 * i)
+            levels.append((bucket * factor / rate, np.frombuffer(mm, np.int8, n * 2, offset).reshape(n, 2))); offset += n * 2
+        return levels
+    except (OSError, ValueError, struct.error): return None
+
+class PeakCache(QObject):
+    # Dalga biçimi tepe dizileri; dosya kimliği (yol, mtime, boyut) anahtarıyla diskte. Önbellekteki parça için
+    # çözme yapılmaz; eksikse tek bir işçi süreç üretir ve kısmi sonuçlar geldikçe peaksReady yayılır
+    peaksReady = pyqtSignal(str, object)
+    rawResult = pyqtSignal(object)
+
+    def __init__(self, folder, parent=None):
+        super().__init__(parent)
+        self.folder = folder; self.process = None; self.jobs = self.results = self.cancel = None; self.pending = None; self.partial = []
+        self.rawResult.connect(self.deliver)
+
+    def cache_file(self, path):
+        st = os.stat(path); key = hashlib.blake2b(f"{path}\0{st.st_mtime_ns}\0{st.st_size}".encode(), digest_size=16).hexdigest()
+        return os.path.join(self.folder, key + ".peaks")
+
+    def request(self, path):
+        if not load_numpy(): return None # numpy yoksa işçi başlatılmaz, düz ilerleme çubuğu kalır
+        try: target = self.cache_file(path)
+        except OSError: return None
+        levels = load_peaks(target)
+        if levels is not None:
+            try: os.utime(target)
+            except OSError: pass
+            return levels
+        if path != self.pending or not self.process.is_alive():
+            self.start_worker(); self.pending = path; self.partial = []; self.cancel.set(); self.jobs.put((path, target))
+        return None
+
+    def start_worker(self):
+        # Ölmüş işçinin (çökme, bellek) yerine yenisi başlatılır; eski dinleyici kendi sürecinin ölümünü bildirip çıkar
+        if self.process is not None and self.process.is_alive(): return
+        context = multiprocessing.get_context("spawn")
+        self.jobs = context.Queue(); self.results = context.Queue(); self.cancel = context.Event()
+        self.process = context.Process(target=peak_worker, args=(self.jobs, self.results, self.cancel, self.folder), daemon=True); self.process.start()
+        threading.Thread(target=self.listen, args=(self.process, self.results), daemon=True).start()
+
+    def listen(self, process, results):
+        while True:
+            try: item = results.get(timeout=1)
+            except queue.Empty:
+                if process.is_alive(): continue
+                item = ("died", process)
+            except (EOFError, OSError): return
+            if item is None: return
+            self.rawResult.emit(item)
+            if item[0] == "died": return
+
+    def deliver(self, item):
+        kind, path = item[0], item[1]
+        if kind == "died": # bekleyen parça düz çubukla kalır; sonraki istek yeni işçi başlatır
+            if path is self.process: self.pending = None; self.partial = []
+            return
+        if path != self.pending: return # başka parçaya geçildi
+        if kind == "part":
+            self.partial.append(item[3])
+            self.peaksReady.emit(path, [(PEAK_BUCKET * PEAK_FACTORS[1] / item[2], np.concatenate(self.partial))]); return
+        self.pending = None; self.partial = []
+        levels = load_peaks(item[2]) if kind == "done" else None
+        if levels is not None: self.peaksReady.emit(path, levels)
+
+    def stop(self):
+        if self.process is not None: self.cancel.set(); self.jobs.put(None); self.results.put(None)
+
+class SpectrumAnalyzer:
+    # Son fft_size örnek sabit bir tamponda tutulur. rfft her karede değil `stride` karede bir yapılır (30 fps'de 7.5 Hz);
+    # o an yeni PCM geldiyse bantlar yeni hedef olur. Sonraki stride karenin hedefe yumuşak yaklaşan çubuk yükseklikleri
+    # aynı anda tek seferde hesaplanır, aradaki karelerde yalnızca hazır liste alınır. Pencere ve bant sınırları bir kez kurulur
+    def __init__(self, bands, fft_size=1024, stride=4, ease=0.5):
+        self.bands = bands; self.fft_size = fft_size
+        self.window = np.hanning(fft_size).astype(np.float32); self.buffer = np.zeros(fft_size, np.float32); self.frame = np.empty(fft_size, np.float32)
+        self.rate = 0; self.stop = 0; self.starts = self.scale = None; self.fresh = False
+        self.levels = np.zeros(bands, np.float32); self.target = np.zeros(bands, np.float32); self.frames = []
+        self.remain = ((1 - ease) ** np.arange(stride, 0, -1, dtype=np.float32))[:, None] # k. karede hedefe kalan fark, ters sırada
+
+    def set_rate(self, rate):
+        if rate == self.rate or rate <= 0: return
+        self.rate = rate; half = self.fft_size // 2
+        # 40 Hz .. 16 kHz arası logaritmik bant sınırları, FFT kutularına yuvarlanmış
+        freqs = np.geomspace(40, min(16000, rate / 2), self.bands + 1)
+        bins = np.clip(np.round(freqs * self.fft_size / rate).astype(int), 1, half)
+        steps = np.arange(bins.size); bins = np.minimum(np.maximum.accumulate(bins - steps) + steps, half + 1) # her bant en az bir kutu
+        starts = np.minimum(bins[:-1], half); self.stop = int(min(max(bins[-1], starts[-1] + 1), half + 1))
+        # rfft çıktısı (gerçel, sanal) çiftleri olarak okunur; bant gücü bu çiftlerin karelerinin toplamıdır
+        self.starts = 2 * starts; self.real = np.fft.rfft(self.window).real.dtype # numpy 2: float32, 1.x: float64
+        # -60 dBFS .. -5 dBFS → 0..1: log10(bant ortalaması * scale) * 2/11, tam ölçekli sinüs 0 dBFS
+        scale = 10 ** ((60 - 20 * math.log10(self.fft_size / 4)) / 10)
+        self.scale = (scale / np.maximum(1, np.diff(np.append(starts, self.stop)))).astype(np.float32)
+
+    def push(self, samples, rate):
+        self.set_rate(rate); n = samples.size
+        if n >= self.fft_size: self.buffer[:] = samples[-self.fft_size:]
+        elif n: self.buffer[:-n] = self.buffer[n:]; self.buffer[-n:] = samples
+        self.fresh = True
+
+    def analyze(self, height):
+        # Bu karenin çubuk yükseklikleri (0..height) liste olarak
+        if self.frames: return self.frames.pop()
+        target = self.target
+        if self.fresh and self.starts is not None:
+            self.fresh = False
+            np.multiply(self.buffer, self.window, out=self.frame)
+            power = np.fft.rfft(self.frame)[:self.stop].view(self.real); np.square(power, out=power)
+            band = np.add.reduceat(power, self.starts); band *= self.scale; np.maximum(band, 1.0, out=band); np.log10(band, out=band)
+            np.minimum(band, 5.5, out=band); np.multiply(band, 2 / 11, out=target)
+        steps = (target - self.levels) * self.remain; np.subtract(target, steps, out=steps); self.levels = steps[0].copy()
+        steps *= height; self.frames = steps.tolist()
+        return self.frames.pop()
+
+class ModernSpectrum(QWidget):
+    modeChanged = pyqtSignal(int)
+    animationNeeded = pyqtSignal()
+
+    def __init__(self):
+        super().__init__()
+        self.player = None
+        self.color = QColor("#00e676")
+        self.bars = 35
+        self.mode = 0
+        self.heights = [0.0] * self.bars
+        self.target_heights = [0.0] * self.bars
+        self.analyzer = None; self.tap = None; self.last_pcm = 0.0
+        self.layer_key = None; self.background = None; self.scanlines = None
+        self.setToolTip("Görünümü değiştirmek için tıkla!")
+
+    def attach(self, player):
+        # Çözülmüş PCM akışına dokun (numpy ve Qt 6.8+ varsa; yoksa eski rastgele animasyon kullanılır).
+        # Kesintisiz geçişte dokunuş yeni etkin oynatıcıya taşınır.
+        if self.tap is None and np and QAudioBufferOutput is not None:
+            self.analyzer = SpectrumAnalyzer(self.bars)
+            self.tap = QAudioBufferOutput(self); self.tap.audioBufferReceived.connect(self.on_audio_buffer)
+        if self.tap is not None:
+            if self.player is not None: self.player.setAudioBufferOutput(None)
+            player.setAudioBufferOutput(self.tap)
+        self.player = player; self.animationNeeded.emit()
+
+    def on_audio_buffer(self, buffer):
+        pcm = buffer_samples(buffer)
+        if pcm is None: return
+        samples, rate = pcm; self.analyzer.push(samples.mean(axis=1), rate); self.last_pcm = time.monotonic()
+
+    def mousePressEvent(self, event):
+        self.mode = (self.mode + 1) % 10
+        self.modeChanged.emit(self.mode)
+        self.update()
+
+    def playing(self): return self.player is not None and self.player.playbackState() == QMediaPlayer.PlaybackState.PlayingState
+
+    def wants_frames(self): return self.isVisible() and (self.playing() or any(h > 0 for h in self.heights))
+
+    def advance(self, dt): self.animate()
+
+    def showEvent(self, event): super().showEvent(event); self.animationNeeded.emit()
+
+    def animate(self):
+        playing = self.playing()
+        if playing and self.analyzer is not None and time.monotonic() - self.last_pcm < 0.5:
+            self.heights = self.analyzer.analyze(max(0, self.height() - 15)); self.update(); return
+        for i in range(self.bars):
+            self.target_heights[i] = random.uniform(5, self.height() - 15) if playing else 0
+            self.heights[i] += (self.target_heights[i] - self.heights[i]) * 0.2
+        if not playing and max(self.heights) < 0.5: self.heights = [0.0] * self.bars # söndü; zamanlayıcı durabilir
+        self.update()
+
+    def static_layers(self):
+        # Arka plan + ızgara ve tarama çizgileri yalnızca boyut/tema değişince yeniden çizilir
+        key = (self.width(), self.height(), self.devicePixelRatioF(), self.color.rgba())
+        if self.layer_key == key: return self.background, self.scanlines
+        self.layer_key = key; w, h = self.width(), self.height()
+        self.background = self.make_layer(QColor("#000000"))
+        painter = QPainter(self.background); painter.setPen(QColor(30, 30, 30))
+        painter.drawLines([QLineF(x, 0, x, h) for x in range(0, w, 20)] + [QLineF(0, y, w, y) for y in range(0, h, 20)]); painter.end()
+        self.scanlines = self.make_layer(Qt.GlobalColor.transparent)
+        painter = QPainter(self.scanlines); painter.setPen(QColor(255, 255, 255, 15))
+        painter.drawLines([QLineF(0, y, w, y) for y in range(0, h, 3)]); painter.end()
+        return self.background, self.scanlines
+
+    def make_layer(self, fill):
+        dpr = self.devicePixelRatioF()
+        pixmap = QPixmap(max(1, round(self.width() * dpr)), max(1, round(self.height() * dpr)))
+        pixmap.setDevicePixelRatio(dpr); pixmap.fill(fill)
+        return pixmap
+
+    @profiled("ModernSpectrum.paintEvent")
+    def paintEvent(self, event):
+        background, scanlines = self.static_layers()
+        painter = QPainter(self); painter.drawPixmap(0, 0, background)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        # Her kare tek bir ortak gradyan ve her mod için tek bir toplu çizim çağrısı
+        H = self.height(); w = self.width() / self.bars; mid_y = H / 2; hs = self.heights; xs = [i * w for i in range(self.bars)]
+        grad = QLinearGradient(QPointF(0, float(H)), QPointF(0, 0.0))
+        grad.setColorAt(0, self.color); grad.setColorAt(1, QColor(255, 255, 255, 180))
+        painter.setBrush(grad); painter.setPen(Qt.PenStyle.NoPen)
+        mode = self.mode
+        if mode in (0, 1, 2):
+            path = QPainterPath()
+            for x, h in zip(xs, hs):
+                top = H - h if mode == 0 else mid_y - h / 2 if mode == 1 else 0
+                path.addRoundedRect(QRectF(int(x + 2), int(top), int(w - 4), int(h)), 2, 2)
+            painter.drawPath(path)
+        elif mode == 3:
+            painter.setPen(QPen(self.color, 2))
+            painter.drawLines([QLineF(int(x + w/2), H, int(x + w/2), int(H - h)) for x, h in zip(xs, hs)])
+        elif mode == 4:
+            path = QPainterPath()
+            for x, h in zip(xs, hs): path.addEllipse(QPointF(x + w/2, H - h), 3, 3)
+            painter.drawPath(path)
+        elif mode == 5:
+            painter.drawRects([QRectF(int(x + 2), int(H - h), int(w - 4), 4) for x, h in zip(xs, hs)] +
+                              [QRectF(int(x + 2), int(h), int(w - 4), 4) for x, h in zip(xs, hs)])
+        elif mode == 6:
+            painter.drawRects([QRectF(int(x + 2), int(H - (h // 12) * 12), int(w - 4), int((h // 12) * 12)) for x, h in zip(xs, hs)])
+        elif mode == 7:
+            painter.drawRects([QRectF(int(x + 2), H - b * 10, int(w - 4), 7) for x, h in zip(xs, hs) for b in range(int(h // 10))])
+        elif mode == 8:
+            painter.setPen(QPen(self.color, 2)); painter.setBrush(Qt.BrushStyle.NoBrush)
+            painter.drawPolyline(QPolygonF([QPointF(int(x), int(H - h)) for x, h in zip(xs, hs)]))
+        elif mode == 9:
+            painter.setBrush(QColor(self.color.red(), self.color.green(), self.color.blue(), 100))
+            painter.drawPolygon(QPolygonF([QPointF(0, H)] + [QPointF(x, H - h) for x, h in zip(xs, hs)] +
+                                          [QPointF(self.bars * w, H - hs[-1]), QPointF(self.bars * w, H)]))
+
+        # Scanlines (LCD Efekti)
+        painter.drawPixmap(0, 0, scanlines)
+
+class ProfileOverlay(QLabel):
+    # LCD panelinin köşesinde profil özeti; fare olaylarını altındaki spektruma bırakır
+    names = {"event_loop.lag": "döngü", "ModernSpectrum.paintEvent": "spektrum", "ScrollingLabel.paintEvent": "başlık",
+             "ProVolumeKnob.paintEvent": "düğme", "play_file.load_to_play": "yükleme"}
+
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents); self.setFont(QFont("DejaVu Sans Mono", 7))
+        self.setStyleSheet("color: #e0e0e0; background: rgba(0, 0, 0, 170); padding: 2px 4px; border-radius: 3px;")
+        self.timer = QTimer(self); self.timer.setInterval(500); self.timer.timeout.connect(self.refresh); self.timer.start(); self.refresh()
+
+    def refresh(self):
+        lines = [f"{self.names.get(name, name):<16} {s['mean_ms']:6.2f} {s['p95_ms']:6.2f} {s['max_ms']:7.1f} ×{s['count']}"
+                 for name, s in sorted(PROFILE.summary().items())]
+        self.setText("\n".join([f"{'ms':<16} {'ort':>6} {'p95':>6} {'maks':>7}"] + lines)); self.adjustSize(); self.move(4, 4); self.raise_()
+
+class TurkaPlayer(QMainWindow):
+    # Pencere: oynatma, liste ve ayarlar PlayerEngine'dedir; burada yalnızca görünüm, tema ve kullanıcı eylemleri bulunur
+    def __init__(self):
+        super().__init__()
+        self.setWindowTitle("Turka Music Player")
+        icon_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ICON_NAME) # paketin bir üstünde
+        if os.path.exists(icon_path): self.setWindowIcon(QIcon(icon_path))
+
+        # Çoklu ortam arka ucu ilk boyamadan sonra kurulur (engine.start)
+        self.engine = PlayerEngine(self); self.playlist = self.engine.playlist; self.metadata = self.engine.metadata; self.settings = self.engine.settings
+        self.ready = False; self.staged = False; self.applied_styles = {}; self.scheduler = FrameScheduler(parent=self); self.pending_pos = 0; self.pos_dirty = False
+        self.peaks = PeakCache(PEAK_DIR, self); self.current_meta = ""
+        self.search_timer = QTimer(self); self.search_timer.setSingleShot(True); self.search_timer.setInterval(150); self.search_timer.timeout.connect(self.apply_filter)
+        self.meta_timer = QTimer(self); self.meta_timer.setSingleShot(True); self.meta_timer.setInterval(250); self.meta_timer.timeout.connect(self.refresh_metadata_views)
+        self.is_dark_mode = True; self.is_list_visible = False 
+        
+        self.themes = ["#00e676", "#00b0ff", "#ff3d00", "#d4af37", "#bd93f9", "#ff79c6", "#8be9fd", "#50fa7b", "#ffb86c", "#ff5555", "#f1fa8c", "#00d2ff", "#9c27b0", "#76ff03", "#ffffff", "#ff9800", "#03a9f4", "#e91e63", "#607d8b", "#795548"]
+        self.current_theme_idx = 0
+        self.collapsed_width = 440; self.expanded_width = 850; self.player_height = 520
+        
+        self.init_ui(); STARTUP.mark("arayüz")
+        if PROFILE.enabled: PROFILE.start(self); self.profile_overlay = ProfileOverlay(self.lcd_container)
+        self.engine.view_state = self.settings_snapshot
+        self.load_config(); STARTUP.mark("ayarlar")
+        self.toggle_list(force=self.is_list_visible); STARTUP.mark("tema")
+        self.center_window()
+
+    def finish_startup(self):
+        # İlk boyamadan sonra: sinyaller, ardından çekirdeğin çoklu ortam arka ucu ve çalma listesi
+        STARTUP.mark("gösterim + ilk boyama")
+        load_numpy(); STARTUP.mark("numpy")
+        self.setup_logic()
+        self.engine.start(); STARTUP.mark("çoklu ortam + çalma listesi")
+        self.list.loudness_state = self.engine.loudness.state(); self.ready = True; STARTUP.report()
+
+    def center_window(self):
+        qr = self.frameGeometry()
+        cp = QGuiApplication.primaryScreen().availableGeometry().center()
+        qr.moveCenter(cp)
+        self.move(qr.topLeft())
+
+    def init_ui(self):
+        main_widget = QWidget(); self.setCentralWidget(main_widget)
+        self.layout_horizontal = QHBoxLayout(main_widget); self.layout_horizontal.setContentsMargins(15, 15, 15, 15); self.layout_horizontal.setSpacing(15)
+
+        self.left_panel = QWidget(); self.layout_left = QVBoxLayout(self.left_panel); self.layout_left.setContentsMargins(0, 0, 0, 0); self.layout_left.setSpacing(10); self.left_panel.setFixedWidth(400)
+        self.lcd_container = QFrame(); self.lcd_container.setObjectName("LCDContainer"); self.lcd_container.setFixedHeight(180) 
+        lcd_lyt = QVBoxLayout(self.lcd_container); lcd_lyt.setContentsMargins(12, 10, 12, 10)
+        self.title_lbl = ScrollingLabel("Turka Music Player - Hazır"); lcd_lyt.addWidget(self.title_lbl)
+        self.vumeter = ModernSpectrum(); lcd_lyt.addWidget(self.vumeter)
+        self.layout_left.addWidget(self.lcd_container)
+
+        self.progress_container = QWidget(); prog_lyt = QVBoxLayout(self.progress_container); prog_lyt.setContentsMargins(5, 0, 5, 0); prog_lyt.setSpacing(2)
+        self.time_lbl = QLabel("00:00 / 00:00"); self.time_lbl.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.progress_bar = WaveformSeekBar(); prog_lyt.addWidget(self.time_lbl); prog_lyt.addWidget(self.progress_bar); self.layout_left.addWidget(self.progress_container)
+
+        self.top_btn_container = QWidget(); top_btn_layout = QHBoxLayout(self.top_btn_container); top_btn_layout.setContentsMargins(0, 0, 0, 0); top_btn_layout.setSpacing(8) 
+        self.btn_add = self.create_rect_btn("Ekle +", 65, 30); self.btn_list_toggle = self.create_rect_btn("Liste ≣", 65, 30)
+        self.btn_shuffle = self.create_rect_btn("Rastgele", 65, 30); self.btn_repeat = self.create_rect_btn("Tekrarla", 65, 30)
+        self.btn_theme = self.create_rect_btn("Tema", 60, 30); self.btn_mode = self.create_rect_btn("☾", 35, 30) 
+        for b in [self.btn_add, self.btn_list_toggle, self.btn_shuffle, self.btn_repeat, self.btn_theme, self.btn_mode]: top_btn_layout.addWidget(b)
+        self.layout_left.addWidget(self.top_btn_container)
+
+        self.volume_container = QFrame(); self.volume_container.setObjectName("VolumePanel"); self.volume_container.setFixedHeight(130)
+        volume_layout = QHBoxLayout(self.volume_container); volume_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.btn_vol_down = self.create_circle_btn("-", 38); self.knob = ProVolumeKnob(); self.btn_vol_up = self.create_circle_btn("+", 38)
+        volume_layout.addWidget(self.btn_vol_down); volume_layout.addWidget(self.knob); volume_layout.addWidget(self.btn_vol_up); self.layout_left.addWidget(self.volume_container)
+        
+        self.nav_container = QFrame(); self.nav_container.setObjectName("NavPanel"); self.nav_container.setFixedHeight(85)
+        nav_layout = QHBoxLayout(self.nav_container); nav_layout.setSpacing(12); nav_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.btn_back5 = self.create_circle_btn("⟲", 38); self.btn_prev = self.create_circle_btn("◀", 48); self.btn_play = self.create_circle_btn("▶", 65); self.btn_next = self.create_circle_btn("▶", 48); self.btn_fwd5 = self.create_circle_btn("⟳", 38)
+        for b in [self.btn_back5, self.btn_prev, self.btn_play, self.btn_next, self.btn_fwd5]: nav_layout.addWidget(b)
+        self.layout_left.addWidget(self.nav_container); self.layout_horizontal.addWidget(self.left_panel)
+
+        self.right_panel = QWidget(); self.layout_right = QVBoxLayout(self.right_panel); self.layout_right.setContentsMargins(0, 0, 0, 0); self.layout_right.setSpacing(10)
+        self.search_bar = QLineEdit(); self.search_bar.setPlaceholderText("Parçalarda ara..."); self.search_bar.setFixedHeight(35)
+        self.playlist.missing_color = QColor(128, 128, 128); self.search_index = SearchIndex(self.playlist, self.metadata)
+        self.sort_keys = SortKeys(self.metadata); self.filter_model = PlaylistProxy(self.sort_keys, self); self.filter_model.setSourceModel(self.playlist); self.list = DragDropList(); self.list.setModel(self.filter_model)
+        self.summary_lbl = QLabel(); self.scan_lbl = QLabel(); self.scan_lbl.setVisible(False)
+        for w in [self.search_bar, self.list, self.summary_lbl, self.scan_lbl]: self.layout_right.addWidget(w)
+        self.layout_horizontal.addWidget(self.right_panel)
+
+    def create_circle_btn(self, text, size): btn = QPushButton(text); btn.setFixedSize(size, size); return btn
+    def create_rect_btn(self, text, w, h): btn = QPushButton(text); btn.setFixedSize(w, h); return btn
+
+    def toggle_list(self, force=None):
+        if force is not None: self.is_list_visible = force
+        else: self.is_list_visible = not self.is_list_visible
+        self.right_panel.setVisible(self.is_list_visible)
+        new_width = self.expanded_width if self.is_list_visible else self.collapsed_width
+        self.setFixedSize(new_width, self.player_height); self.apply_theme_styles()
+
+    @profiled("apply_theme_styles")
+    def apply_theme_styles(self):
+        # Yalnızca gerçekten değişen stil sayfaları uygulanır; oynat/duraklat bu yolu hiç kullanmaz (update_play_state)
+        color = self.themes[self.current_theme_idx]; styles = theme_styles(color, self.is_dark_mode)
+        if self.knob.color.name() != color or self.knob.is_dark != self.is_dark_mode:
+            qcolor = QColor(color); self.knob.is_dark = self.is_dark_mode; self.knob.color = qcolor; self.vumeter.color = qcolor; self.knob.update(); self.vumeter.update(); self.progress_bar.setColor(qcolor)
+        targets = [(self, styles["window"]), (self.centralWidget(), styles["panels"]), (self.btn_play, styles["play"]),
+                   (self.btn_shuffle, styles["rect_active" if self.engine.shuffle else "rect"]), (self.btn_repeat, styles["rect_active" if self.engine.repeat else "rect"]),
+                   (self.time_lbl, styles["time"])]
+        if self.is_list_visible: # gizli liste paneli ilk gösterildiğinde biçimlenir
+            targets += [(self.search_bar, styles["search"]), (self.list, styles["list"]), (self.scan_lbl, styles["small"]), (self.summary_lbl, styles["small"])]
+        targets += [(b, styles["round"]) for b in [self.btn_vol_down, self.btn_vol_up, self.btn_back5, self.btn_prev, self.btn_next, self.btn_fwd5]]
+        targets += [(b, styles["rect"]) for b in [self.btn_add, self.btn_theme, self.btn_mode, self.btn_list_toggle]]
+        for widget, sheet in targets:
+            if self.applied_styles.get(widget) is not sheet: widget.setStyleSheet(sheet); self.applied_styles[widget] = sheet
+        self.update_play_state()
+
+    def update_play_state(self, *args):
+        if self.engine.player is None: return
+        playing = self.engine.playing(); self.btn_play.setText("❚❚" if playing else "▶"); self.title_lbl.set_running(playing)
+
+    def setup_logic(self):
+        engine = self.engine
+        self.btn_add.clicked.connect(self.manual_add); self.btn_theme.clicked.connect(self.change_theme); self.btn_mode.clicked.connect(self.toggle_mode)
+        self.btn_list_toggle.clicked.connect(lambda: self.toggle_list()); self.btn_shuffle.clicked.connect(lambda: engine.set_shuffle(not engine.shuffle))
+        self.btn_repeat.clicked.connect(lambda: engine.set_repeat(not engine.repeat))
+        self.btn_vol_up.clicked.connect(lambda: self.change_volume(5)); self.btn_vol_down.clicked.connect(lambda: self.change_volume(-5))
+        self.list.rowActivated.connect(engine.play_file); self.btn_play.clicked.connect(engine.toggle_play)
+        self.btn_next.clicked.connect(engine.next_track); self.btn_prev.clicked.connect(engine.prev_track)
+        self.btn_back5.clicked.connect(lambda: engine.seek_by(-5000)); self.btn_fwd5.clicked.connect(lambda: engine.seek_by(5000))
+        self.knob.valueChanged.connect(lambda v: engine.set_volume(v, save=False)); self.knob.valueCommitted.connect(engine.set_volume)
+        engine.volumeChanged.connect(self.knob.setValue); engine.modesChanged.connect(self.update_modes)
+        engine.positionChanged.connect(self.update_pos); engine.durationChanged.connect(self.update_dur); engine.stateChanged.connect(self.update_play_state)
+        engine.stateChanged.connect(self.scheduler.wake); engine.playerChanged.connect(self.vumeter.attach); engine.trackStarted.connect(self.start_track)
+        # Geçerli satır çekirdekte tutulur; listede seçilen satır "sonraki/önceki" için başlangıç olur
+        engine.currentChanged.connect(self.list.setCurrentRow)
+        self.list.selectionModel().currentChanged.connect(self.select_row)
+        self.playlist.rowsRemoved.connect(lambda *args: self.list.setCurrentRow(self.engine.current)) # silmeden sonra görünüm çekirdeğe uyar
+        self.scheduler.add(self.title_lbl.wants_frames, self.title_lbl.advance, self.title_lbl.animationNeeded)
+        self.scheduler.add(self.vumeter.wants_frames, self.vumeter.advance, self.vumeter.animationNeeded)
+        self.scheduler.add(lambda: self.pos_dirty, lambda dt: self.refresh_position())
+        self.progress_bar.sliderMoved.connect(engine.seek); self.list.fileDropped.connect(self.handle_dropped_files)
+        self.list.deleteRequested.connect(self.remove_selected_item); self.list.clearRequested.connect(engine.clear); self.search_bar.textChanged.connect(self.filter_playlist)
+        self.vumeter.modeChanged.connect(lambda: self.save_settings())
+        engine.scanner.progress.connect(self.show_scan_progress); engine.scanner.finished.connect(lambda total: self.end_scan())
+        self.list.cancelScanRequested.connect(self.cancel_scan); self.list.playNextRequested.connect(self.play_next)
+        self.list.library_roots = engine.library.roots; self.list.addLibraryRequested.connect(self.add_library_root); self.list.removeLibraryRequested.connect(engine.remove_library_root)
+        engine.library.changed.connect(self.on_library_changes); engine.library.syncing.connect(self.show_library_sync)
+        self.list.sortRequested.connect(self.sort_playlist); engine.order.sequence = self.filter_model.sequence
+        self.list.exportRequested.connect(self.export_playlist); self.list.findDuplicatesRequested.connect(self.find_duplicates); engine.duplicates.found.connect(self.offer_duplicates)
+        engine.duplicates.progress.connect(lambda done, total: self.scan_lbl.setText(f"Kopyalar aranıyor… {done}/{total}"))
+        self.list.normalize = engine.normalize; self.list.loudnessRequested.connect(self.control_loudness); self.list.normalizeToggled.connect(engine.set_normalize)
+        engine.loudness.progress.connect(self.show_loudness_progress); engine.loudness.finished.connect(self.end_loudness); self.peaks.peaksReady.connect(self.on_peaks)
+        self.metadata.infoReady.connect(self.on_metadata)
+        for signal in (self.playlist.rowsInserted, self.playlist.rowsRemoved, self.playlist.modelReset): signal.connect(lambda *args: self.schedule_metadata_refresh())
+        for signal in (self.playlist.rowsInserted, self.playlist.rowsRemoved, self.playlist.modelReset): signal.connect(lambda *args: self.refresh_search())
+
+    def update_modes(self): self.list.normalize = self.engine.normalize; self.apply_theme_styles()
+
+    def select_row(self, *args):
+        if self.filter_model.removing: return # silinen satırın yerine görünümün kendi seçtiği satır; geçerli satırı çekirdek belirler
+        row = self.list.currentRow()
+        if row >= 0: self.engine.set_current(row)
+
+    def filter_playlist(self, text): self.search_timer.start() # yazarken bekle, son tuştan sonra bir kez ara
+
+    @profiled("filter_playlist")
+    def apply_filter(self):
+        self.filter_model.set_allowed(self.search_index.search(self.search_bar.text()))
+        if not self.list.currentIndex().isValid(): self.list.setCurrentRow(self.engine.current) # süzgeçte gizli kalsa da hatırlanır
+
+    def sort_playlist(self, column, descending):
+        # Yalnızca görünümün sırası değişir; kaynak satırları, geçerli parça ve current_index aynı kalır
+        self.filter_model.sort_by(column, descending); self.list.sort_state = (self.filter_model.column, self.filter_model.descending)
+        self.list.scrollTo(self.list.currentIndex()); self.save_settings()
+
+    def refresh_search(self, paths=None):
+        self.search_index.invalidate(paths)
+        if self.search_bar.text().strip() and not self.search_timer.isActive(): self.search_timer.start()
+
+    def remove_selected_item(self): self.engine.remove_rows(self.list.selected_rows() or [self.list.currentRow()])
+
+    def play_next(self): self.engine.enqueue(self.list.selected_rows() or [self.list.currentRow()])
+
+    def manual_add(self):
+      files, _ = QFileDialog.getOpenFileNames(self, "Müzik Seç", "", "Ses Dosyaları (*.mp3 *.wav *.flac *.m4a *.mpga *.aac *.ogg *.opus *.wma *.m4b *.aiff *.mid *.amr *.au *.snd *.ac3 *.voc *.mka);;Çalma Listeleri (*.m3u *.m3u8 *.pls)")
+      if files: self.start_scan(files)
+
+    def remote_command(self, cmd, args):
+        # Pencereyle ilgili komutlar burada; geri kalanı çekirdeğe gider
+        if cmd == "show" or cmd == "open" and args.get("paths") and self.engine.ready: self.showNormal(); self.raise_(); self.activateWindow()
+        if cmd == "show": return {}
+        return self.engine.command(cmd, args)
+
+    def export_playlist(self):
+        path, _ = QFileDialog.getSaveFileName(self, "Listeyi Dışa Aktar", "turkamp.m3u8", "M3U8 (*.m3u8);;M3U (*.m3u);;PLS (*.pls)")
+        if not path: return
+        if not path.lower().endswith(PLAYLIST_FORMATS): path += ".m3u8"
+        try: write_playlist(path, self.playlist.paths, self.metadata.get)
+        except OSError as e: QMessageBox.warning(self, "Dışa Aktarma", f"Liste yazılamadı: {e}")
+
+    def handle_dropped_files(self, paths): self.start_scan(paths)
+
+    def start_scan(self, paths): self.list.scan_active = True; self.engine.scan(paths)
+
+    def show_scan_progress(self, count, rate):
+        if not self.engine.scanner.is_running(): return
+        self.scan_lbl.setText(f"Taranıyor… {count} dosya · {rate:.0f} dosya/sn (Esc: iptal)"); self.scan_lbl.setVisible(True)
+
+    def end_scan(self):
+        if self.engine.scanner.is_running(): return
+        self.list.scan_active = False; self.scan_lbl.setVisible(False)
+
+    def cancel_scan(self): self.engine.cancel_scan(); self.end_scan()
+
+    def add_library_root(self):
+        folder = QFileDialog.getExistingDirectory(self, "Kütüphane Klasörü Seç")
+        if folder: self.engine.add_library_root(folder)
+
+    def show_library_sync(self, active):
+        if active: self.scan_lbl.setText("Kütüphane eşitleniyor…"); self.scan_lbl.setVisible(True)
+        elif not self.engine.scanner.is_running(): self.scan_lbl.setVisible(False)
+
+    def on_library_changes(self, added, removed, renamed):
+        if renamed: paths = [p for pair in renamed for p in pair]; self.filter_model.refresh_keys(paths); self.refresh_search(paths)
+
+    def control_loudness(self, command):
+        self.engine.control_loudness(command)
+        if command == "start" and self.engine.loudness.running: self.scan_lbl.setText("Ses düzeyi analizi başlıyor…"); self.scan_lbl.setVisible(True)
+        elif command == "stop": self.end_loudness(0, 0.0)
+        self.list.loudness_state = self.engine.loudness.state()
+
+    def show_loudness_progress(self, done, total, rate):
+        eta = (total - done) / rate if rate > 0 else 0
+        self.scan_lbl.setText(f"Ses düzeyi analizi… {done}/{total} · {rate:.1f} parça/sn · kalan ~{format_duration(eta)}"); self.scan_lbl.setVisible(True)
+
+    def end_loudness(self, count, seconds):
+        self.list.loudness_state = self.engine.loudness.state()
+        if not self.engine.scanner.is_running(): self.scan_lbl.setVisible(False)
+        if count and PROFILE.enabled: PROFILE.add_stat("loudness.scan", seconds * 1000) # toplam analiz süresi profil özetine
+
+    def find_duplicates(self):
+        if self.engine.duplicates.running or not self.playlist.paths: return
+        self.scan_lbl.setText("Kopyalar aranıyor…"); self.scan_lbl.setVisible(True); self.engine.duplicates.start(self.playlist.paths)
+
+    def offer_duplicates(self, groups):
+        if not self.engine.scanner.is_running(): self.scan_lbl.setVisible(False)
+        groups = [[p for p in group if self.playlist.contains(p)] for group in groups]; groups = [g for g in groups if len(g) > 1]
+        if not groups: QMessageBox.information(self, "Kopyalar", "Aynı kaydın başka bir kopyası bulunamadı."); return
+        extra = sum(len(g) - 1 for g in groups)
+        answer = QMessageBox.question(self, "Kopyalar", f"{len(groups)} kayıt birden fazla yolda bulundu ({extra} fazla satır). Her kayıttan tek satır kalsın mı?")
+        if answer == QMessageBox.StandardButton.Yes: self.engine.remove_duplicates(groups)
+
+    def change_theme(self): 
+        self.current_theme_idx = (self.current_theme_idx + 1) % len(self.themes)
+        self.apply_theme_styles(); self.save_settings()
+
+    def toggle_mode(self):
+        self.is_dark_mode = not self.is_dark_mode
+        self.btn_mode.setText("☾" if self.is_dark_mode else "☼"); self.apply_theme_styles(); self.save_settings()
+
+    def change_volume(self, delta): self.engine.set_volume(self.engine.volume + delta)
+
+    def start_track(self, row, path):
+        self.progress_bar.set_peaks(self.peaks.request(path))
+        self.title_lbl.setText(display_name(path, self.metadata.get(path))); self.current_meta = self.track_meta_text(path)
+
+    @profiled("update_pos")
+    def update_pos(self, p):
+        # Etiket ve çubuk yenilemesi çerçeve zamanlayıcısına bırakılır (ekran hızında en fazla bir kez)
+        self.pending_pos = p; self.pos_dirty = True; self.scheduler.wake()
+
+    def refresh_position(self):
+        p = self.pending_pos; self.pos_dirty = False
+        self.progress_bar.setValue(p)
+        m, s = divmod(p // 1000, 60)
+        dm, ds = divmod(self.engine.player.duration() // 1000, 60)
+        self.time_lbl.setText(f"{self.current_meta}  {m:02}:{s:02} / {dm:02}:{ds:02}")
+
+    def track_meta_text(self, path):
+        # Metadata Bilgisi; parça başına bir kez hesaplanır, konum değişimlerinde diske dokunulmaz
+        ext = os.path.splitext(path)[1].upper()[1:]; info = self.metadata.get(path)
+        if info is None: self.metadata.request([path]); return f"[{ext}]"
+        parts = [ext, f"{info['size'] / (1024 * 1024):.1f}MB"]
+        if info.get("bitrate"): parts.append(f"{info['bitrate']}kbps")
+        if info.get("rate"): parts.append(f"{info['rate'] / 1000:g}kHz")
+        return "[" + " | ".join(parts) + "]"
+
+    def on_metadata(self, paths):
+        current = self.engine.current_path()
+        self.filter_model.refresh_keys(paths); self.refresh_search(paths)
+        if current and current in paths: self.current_meta = self.track_meta_text(current); self.title_lbl.setText(display_name(current, self.metadata.get(current)))
+        self.schedule_metadata_refresh()
+
+    def schedule_metadata_refresh(self):
+        if not self.meta_timer.isActive(): self.meta_timer.start()
+
+    def refresh_metadata_views(self):
+        self.playlist.refresh()
+        total = sum((info.get("duration") or 0) for info in map(self.metadata.get, self.playlist.paths) if info)
+        self.summary_lbl.setText(f"{len(self.playlist.paths)} parça · {format_duration(total)}")
+
+    def on_peaks(self, path, levels):
+        if self.engine.current_path() == path: self.progress_bar.set_peaks(levels)
+
+    def update_dur(self, d): self.progress_bar.setRange(0, d)
+    
+    def save_settings(self): self.engine.save() # yalnızca işaretler; yazma süresi SettingsStore'da ölçülür
+
+    def settings_snapshot(self):
+        # Çekirdeğin ayarlarına eklenen pencere anahtarları
+        return {
+            "theme_index": self.current_theme_idx, "is_dark": self.is_dark_mode, "is_list_visible": self.is_list_visible,
+            "spectrum_mode": self.vumeter.mode, "target_fps": self.scheduler.fps,
+            "sort_column": self.filter_model.column, "sort_descending": self.filter_model.descending
+        }
+
+    def load_config(self):
+        data = self.engine.load_config()
+        try:
+            self.current_theme_idx = data.get("theme_index", 0); self.is_dark_mode = data.get("is_dark", True)
+            self.is_list_visible = data.get("is_list_visible", False)
+            self.knob.setValue(self.engine.volume); self.scheduler.set_fps(data.get("target_fps", 33))
+            self.vumeter.mode = data.get("spectrum_mode", 0); self.btn_mode.setText("☾" if self.is_dark_mode else "☼")
+            self.filter_model.sort_by(data.get("sort_column", "added"), data.get("sort_descending", False)); self.list.sort_state = (self.filter_model.column, self.filter_model.descending)
+        except: pass
+        return data
+
+    def showEvent(self, event):
+        super().showEvent(event); self.scheduler.watch(self); self.scheduler.wake()
+        if not self.staged: self.staged = True; QTimer.singleShot(0, self.finish_startup)
+
+    def closeEvent(self, event): self.engine.close(); self.peaks.stop(); self.sort_keys.stop(); PROFILE.dump(); event.accept()
+
+def main():
+    # Tek örnek: çalışan bir örnek varsa dosya argümanları ona iletilir ve bu süreç pencere kurmadan çıkar (--new-instance ile atlanır).
+    # Pencere olmadan çalıştırmak için: python3 -m turkamp_engine
+    STARTUP.enabled = "--profile-startup" in sys.argv; STARTUP.last = IMPORT_STARTED
+    files = argument_paths(sys.argv[1:])
+    reply = None if "--new-instance" in sys.argv else send_to_running([{"cmd": "open", "paths": files}] if files else [{"cmd": "show"}])
+    if reply is not None:
+        if not all(r.get("ok") for r in reply if isinstance(r, dict)): print("TurkaMP başsız çalışıyor; ikinci pencere için --new-instance", file=sys.stderr)
+        return
+    app = QApplication(PROFILE.configure([a for a in sys.argv if a not in ("--profile-startup", "--new-instance")])); QGuiApplication.setDesktopFileName("turkamp.desktop"); app.setStyle("Fusion")
+    STARTUP.mark("QApplication")
+    ex = TurkaPlayer(); server = CommandServer(SERVER_NAME, ex.remote_command, ex); server.listen()
+    ex.engine.quitRequested.connect(ex.close)
+    if files: ex.engine.pending_commands.append(("open", {"paths": files}))
+    ex.show(); sys.exit(app.exec())
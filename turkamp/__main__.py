@@ -0,0 +1,5 @@
+# python3 -m turkamp. Ana modül ayrı tutulur: spawn ile başlayan işçi süreçleri "__main__" ile biten modülü yeniden
+# çalıştırmaz, yalnızca turkamp_worker'ı yükler (pencere ve Qt yüklenmez)
+from turkamp import main
+
+main()
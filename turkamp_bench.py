@@ -0,0 +1,171 @@
+# TurkaMP başsız performans ölçümü: Qt offscreen platformunda, ses aygıtı olmadan çalışır.
+# Kullanım: python3 turkamp_bench.py --sizes 1000,10000,100000 --output bench.json
+import os
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+import sys
+import json
+import time
+import random
+import argparse
+import platform
+import tempfile
+import subprocess
+from PyQt6.QtCore import QT_VERSION_STR
+from PyQt6.QtGui import QPixmap
+from PyQt6.QtWidgets import QApplication
+import turkamp
+import turkamp_engine
+
+def stats(samples):
+    # Milisaniye cinsinden özet
+    ordered = sorted(samples)
+    if not ordered: return {}
+    return {"count": len(ordered), "mean_ms": round(sum(ordered) / len(ordered), 4), "median_ms": round(ordered[len(ordered) // 2], 4),
+            "p95_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 4), "max_ms": round(ordered[-1], 4)}
+
+def timed(fn):
+    started = time.perf_counter(); fn(); return (time.perf_counter() - started) * 1000
+
+def make_library(root, count, per_folder=100):
+    # Boş dosyalardan oluşan yapay kütüphane: sanatçı klasörleri altında "Sanatçı NNN - Parça NNNNN.mp3"
+    paths = []
+    for i in range(count):
+        folder = os.path.join(root, f"Sanatçı {i // per_folder:04}")
+        if i % per_folder == 0: os.makedirs(folder, exist_ok=True)
+        path = os.path.join(folder, f"Sanatçı {i // per_folder:04} - Parça {i:06}.mp3")
+        open(path, "wb").close(); paths.append(path)
+    return paths
+
+def use_home(home):
+    # Ölçümler kullanıcının gerçek yapılandırmasına dokunmaz
+    turkamp_engine.CONFIG_FILE = os.path.join(home, ".turkamp_config.json")
+    turkamp_engine.PLAYLIST_FILE = os.path.join(home, ".turkamp_playlist.db")
+    turkamp_engine.META_FILE = os.path.join(home, ".turkamp_meta.db")
+    turkamp_engine.LIBRARY_FILE = os.path.join(home, ".turkamp_library.db")
+    turkamp_engine.LOUDNESS_FILE = os.path.join(home, ".turkamp_loudness.db")
+    turkamp.PEAK_DIR = os.path.join(home, "peaks")
+
+def wait_for(app, condition, timeout=600):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline: app.processEvents(); time.sleep(0.001)
+
+def close_window(app, window):
+    window.close(); window.deleteLater(); app.processEvents()
+
+def bench_size(app, size, work):
+    library = os.path.join(work, f"lib_{size}"); home = os.path.join(work, f"home_{size}"); os.makedirs(home)
+    use_home(home); make_library(library, size); result = {}
+
+    # Bırakılan klasörün taranıp listeye eklenmesi (boş listeyle başlayan pencere)
+    window = turkamp.TurkaPlayer(); window.show(); wait_for(app, lambda: window.ready); done = []
+    window.engine.scanner.finished.connect(lambda total: done.append(total))
+    started = time.perf_counter(); window.handle_dropped_files([library])
+    wait_for(app, lambda: done and window.list.count() >= size)
+    result["folder_drop_ms"] = round((time.perf_counter() - started) * 1000, 2); result["folder_drop_tracks"] = window.list.count()
+
+    # Arama kutusu: her tuş vuruşunda filtre maliyeti (sıçrama gecikmesi hariç)
+    keystrokes = []
+    for query in ("sanatçı 004", "parça 0000", "SANATÇI 0012 - PARÇA 0012"):
+        for n in range(1, len(query) + 1):
+            window.search_bar.setText(query[:n]); window.search_timer.stop(); keystrokes.append(timed(window.apply_filter))
+        window.search_bar.setText(""); window.search_timer.stop(); window.apply_filter()
+    result["filter_keystroke"] = stats(keystrokes)
+
+    # Sıralama: ilk çağrıda anahtarlar arka planda üretilir (GUI'deki çağrı süresi ve anahtarlar yerleşene kadar geçen süre),
+    # sonrakiler önbellekteki anahtarlarla tek bir sorted()
+    sorts = {}
+    for column in turkamp.SORT_COLUMNS:
+        started = time.perf_counter(); call = timed(lambda: window.sort_playlist(column, False)); wait_for(app, window.filter_model.settled)
+        sorts[column] = {"cold_call_ms": round(call, 2), "cold_settled_ms": round((time.perf_counter() - started) * 1000, 2),
+                         "warm_ms": round(timed(lambda: window.sort_playlist(column, True)), 2)}
+    window.sort_playlist("added", False); result["sort"] = sorts
+
+    # Ayar kaydı: işaretleme (sıcak yol) ve tam yazma (liste değişmiş ve değişmemiş)
+    result["save_settings_mark"] = stats([timed(window.save_settings) for _ in range(1000)])
+    window.settings.timer.stop(); window.settings.playlist_changed = True
+    result["settings_flush_playlist_changed_ms"] = round(timed(lambda: window.settings.flush(wait=True)), 2)
+    result["settings_flush_unchanged"] = stats([timed(lambda: window.settings.flush(wait=True)) for _ in range(20)])
+    close_window(app, window)
+
+    # Soğuk açılış: ilk kullanılabilir pencere (TurkaPlayer.__init__ + gösterim), ardından ertelenen aşamalar ve kayıtlı liste
+    started = time.perf_counter(); window = turkamp.TurkaPlayer(); window.show(); app.processEvents()
+    result["cold_start_first_window_ms"] = round((time.perf_counter() - started) * 1000, 2)
+    wait_for(app, lambda: window.ready)
+    result["cold_start_ready_ms"] = round((time.perf_counter() - started) * 1000, 2); result["cold_start_tracks"] = window.list.count()
+    result["load_playlist_ms"] = round(timed(lambda: (window.playlist.clear(), window.engine.load_playlist({}))), 2)
+    result["paint"] = bench_paint(window)
+    close_window(app, window)
+    return result
+
+def bench_paint(window, frames=200):
+    # paintEvent süreleri, widget'lar aynı boyuttaki bir pixmap'e çizdirilerek ölçülür
+    out = {}; spectrum = window.vumeter; target = QPixmap(spectrum.size()); rng = random.Random(1)
+    for mode in range(10):
+        spectrum.mode = mode; samples = []
+        for _ in range(frames):
+            spectrum.heights = [rng.uniform(0, spectrum.height() - 15) for _ in range(spectrum.bars)]
+            samples.append(timed(lambda: spectrum.render(target)))
+        out[f"spectrum_mode_{mode}"] = stats(samples)
+    label = window.title_lbl; label.setText("Çok uzun bir parça adı — kayan yazının her karede ne kadar sürdüğünü ölçmek için " * 2)
+    target = QPixmap(label.size()); samples = []
+    for _ in range(frames): label.advance(0.03); samples.append(timed(lambda: label.render(target)))
+    out["scrolling_label"] = stats(samples)
+    knob = window.knob; target = QPixmap(knob.size()); samples = []
+    for i in range(frames): knob.setValue(i % 101); samples.append(timed(lambda: knob.render(target)))
+    out["volume_knob"] = stats(samples)
+    return out
+
+FOOTPRINT_PROBE = """
+import os, sys, time, resource
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+if sys.argv[1] == "headless":
+    from PyQt6.QtCore import QCoreApplication
+    import turkamp_engine
+    app = QCoreApplication([]); owner = turkamp_engine.PlayerEngine(); owner.load_config(); owner.start()
+else:
+    from PyQt6.QtWidgets import QApplication
+    import turkamp
+    app = QApplication([]); owner = turkamp.TurkaPlayer(); owner.show()
+from PyQt6.QtCore import QTimer
+marks = [] # açılış işleri bittikten sonra gerçek olay döngüsünde boşta bekleme
+QTimer.singleShot(3000, lambda: marks.append(time.process_time())); QTimer.singleShot(3000 + int(float(sys.argv[2]) * 1000), app.quit); app.exec()
+# Linux'ta ru_maxrss fork/exec'te ölçümü başlatan sürecin tepesini devralır; bu sürecin kendi tepesi VmHWM'dir
+try:
+    with open("/proc/self/status") as f: peak = next(int(line.split()[1]) for line in f if line.startswith("VmHWM:"))
+except (OSError, StopIteration): peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(peak, time.process_time() - marks[0])
+"""
+
+def bench_footprint(work, size, idle=5.0):
+    # Başsız çekirdek ile pencerenin ayrı süreçlerde tepe RSS'i ve boşta geçen süre boyunca harcanan CPU zamanı
+    home = os.path.join(work, "footprint"); os.makedirs(home, exist_ok=True); use_home(home)
+    store = turkamp_engine.PlaylistStore(turkamp_engine.PLAYLIST_FILE); store.save(make_library(os.path.join(home, "lib"), size))
+    env = dict(os.environ, HOME=home); here = os.path.dirname(os.path.abspath(__file__)); out = {}
+    for mode in ("headless", "window"):
+        proc = subprocess.run([sys.executable, "-c", FOOTPRINT_PROBE, mode, str(idle)], capture_output=True, text=True, cwd=here, env=env)
+        try: rss, cpu = proc.stdout.split()[-2:]
+        except ValueError: out[mode] = {"error": proc.stderr.strip()[-500:]}; continue
+        out[mode] = {"max_rss_mb": round(int(rss) / 1024, 1), "idle_cpu_ms": round(float(cpu) * 1000, 2)}
+    return out
+
+def git_revision():
+    try: return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None
+    except OSError: return None
+
+def main():
+    parser = argparse.ArgumentParser(description="TurkaMP başsız performans ölçümü")
+    parser.add_argument("--sizes", default="1000,10000,100000", help="virgülle ayrılmış kütüphane boyutları")
+    parser.add_argument("--output", default="bench_output.json", help="JSON sonuç dosyası")
+    args = parser.parse_args()
+    app = QApplication(sys.argv); results = {}
+    with tempfile.TemporaryDirectory(prefix="turkamp_bench_") as work:
+        for size in (int(s) for s in args.sizes.split(",") if s.strip()):
+            print(f"{size} parça ölçülüyor...", file=sys.stderr); results[str(size)] = bench_size(app, size, work)
+        print("bellek ve boşta CPU ölçülüyor...", file=sys.stderr); footprint = bench_footprint(work, 10000)
+    report = {"revision": git_revision(), "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"), "python": platform.python_version(),
+              "qt": QT_VERSION_STR, "platform": os.environ.get("QT_QPA_PLATFORM"), "results": results, "footprint": footprint}
+    with open(args.output, "w", encoding="utf-8") as f: json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"Sonuçlar: {args.output}", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,1443 @@
+# TurkaMP çekirdeği: oynatma, çalma listesi, karıştırma/tekrar, kütüphane ve kalıcılık. Yalnızca QtCore, QtMultimedia ve
+# QtNetwork kullanır; pencere (turkamp) bunun üzerinde ince bir görünümdür. Başsız: python3 -m turkamp_engine
+import sys
+import os
+import random
+import json
+import math
+import time
+IMPORT_STARTED = time.perf_counter()
+import sqlite3
+import threading
+import signal
+import socket
+import shlex
+import multiprocessing
+import queue
+from urllib.parse import urlsplit, unquote
+from bisect import bisect_left
+from collections import deque
+from contextlib import closing
+from functools import wraps
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, wait, FIRST_COMPLETED
+from PyQt6.QtCore import (Qt, QTimer, QUrl, pyqtSignal, QAbstractListModel, QModelIndex, QObject, QFileSystemWatcher,
+                          QCoreApplication, QSocketNotifier)
+from PyQt6.QtNetwork import QLocalServer, QLocalSocket
+from PyQt6.QtMultimedia import QMediaPlayer, QAudioOutput, QAudioFormat
+import turkamp_worker
+from turkamp_worker import syncsafe, audio_span, sampled_hash, measure_loudness, lower_priority
+np = None # gerektiğinde load_numpy() ile yüklenir
+
+CONFIG_FILE = os.path.join(os.path.expanduser("~"), ".turkamp_config.json")
+PLAYLIST_FILE = os.path.join(os.path.expanduser("~"), ".turkamp_playlist.db")
+META_FILE = os.path.join(os.path.expanduser("~"), ".turkamp_meta.db")
+LIBRARY_FILE = os.path.join(os.path.expanduser("~"), ".turkamp_library.db")
+LOUDNESS_FILE = os.path.join(os.path.expanduser("~"), ".turkamp_loudness.db")
+SUPPORTED_FORMATS = ('.mp3', '.wav', '.flac', '.m4a', '.mpga', '.aac', '.ogg', '.opus', '.wma', '.m4b', '.aiff', '.mid', '.amr', '.au', '.snd', '.ac3', '.voc', '.mka')
+PLAYLIST_FORMATS = ('.m3u', '.m3u8', '.pls')
+SERVER_NAME = f"turkamp-{os.getuid() if hasattr(os, 'getuid') else os.environ.get('USERNAME', '')}"
+
+def load_numpy():
+    # numpy içe aktarımı pencere açılışını geciktirmesin diye ertelenir; başsız çalışmada ana süreçte hiç yüklenmez
+    global np
+    np = turkamp_worker.load_numpy(); return np
+
+class StartupProfile:
+    # --profile-startup: açılış aşamalarının süreleri (ms) stderr'e yazılır
+    def __init__(self):
+        self.enabled = False; self.last = IMPORT_STARTED; self.phases = []
+
+    def mark(self, name):
+        if not self.enabled: return
+        now = time.perf_counter(); self.phases.append((name, (now - self.last) * 1000)); self.last = now
+
+    def report(self):
+        if not self.enabled: return
+        total = 0.0
+        for name, ms in self.phases: total += ms; print(f"{name:<22} {ms:9.2f} ms  (toplam {total:9.2f} ms)", file=sys.stderr)
+
+STARTUP = StartupProfile()
+
+class Profiler:
+    # --profile[=dosya] ya da TURKAMP_PROFILE=1|dosya: olay döngüsü gecikmesi, boyama ve sıcak yol süreleri.
+    # Kapanışta Chrome/Perfetto trace-event JSON'u yazılır; kapalıyken yalnızca tek bir bayrak denetimi kalır.
+    lag_interval = 50 # ms
+
+    def __init__(self):
+        self.enabled = False; self.path = None; self.origin = time.perf_counter(); self.pid = os.getpid(); self.thread = threading.get_native_id()
+        self.stats = {}; self.events = deque(maxlen=200000); self.timer = None; self.last = 0.0
+
+    def configure(self, argv):
+        value = os.environ.get("TURKAMP_PROFILE", ""); rest = []
+        for arg in argv:
+            if arg == "--profile" or arg.startswith("--profile="): value = arg.partition("=")[2] or "1"
+            else: rest.append(arg)
+        if value and value != "0":
+            self.enabled = True; self.path = os.path.join(os.path.expanduser("~"), ".turkamp_trace.json") if value == "1" else value
+        return rest
+
+    def start(self, parent):
+        # Olay döngüsü gecikmesi: sabit aralıklı zamanlayıcının ne kadar geç tetiklendiği
+        if not self.enabled or self.timer is not None: return
+        self.timer = QTimer(parent); self.timer.setTimerType(Qt.TimerType.PreciseTimer); self.timer.setInterval(self.lag_interval)
+        self.timer.timeout.connect(self.sample_lag); self.last = time.perf_counter(); self.timer.start()
+
+    def sample_lag(self):
+        now = time.perf_counter(); lag = max(0.0, (now - self.last) * 1000 - self.lag_interval); self.last = now
+        self.add_stat("event_loop.lag", lag); self.events.append(("C", "event_loop.lag", now, lag, 0, self.thread))
+
+    def add_stat(self, name, ms):
+        entry = self.stats.get(name)
+        if entry is None: entry = self.stats[name] = [0, 0.0, 0.0, deque(maxlen=200)]
+        entry[0] += 1; entry[1] += ms; entry[2] = max(entry[2], ms); entry[3].append(ms)
+
+    def record(self, name, started, cat="call"):
+        if not self.enabled: return
+        ms = (time.perf_counter() - started) * 1000
+        self.add_stat(name, ms); self.events.append(("X", name, started, ms, cat, threading.get_native_id()))
+
+    def summary(self):
+        out = {}
+        for name, (count, total, peak, recent) in list(self.stats.items()): # yazıcı iş parçacığı da kayıt ekler
+            ordered = sorted(recent)
+            out[name] = {"count": count, "mean_ms": round(total / count, 4), "p95_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 4), "max_ms": round(peak, 4)}
+        return out
+
+    def dump(self):
+        if not self.enabled or not self.path: return
+        trace = []
+        for kind, name, at, ms, cat, tid in self.events:
+            event = {"name": name, "ph": kind, "ts": round((at - self.origin) * 1e6, 1), "pid": self.pid, "tid": tid}
+            if kind == "X": event["dur"] = round(ms * 1000, 1); event["cat"] = cat
+            else: event["args"] = {"ms": round(ms, 3)}
+            trace.append(event)
+        try:
+            with open(self.path, "w", encoding="utf-8") as f:
+                json.dump({"traceEvents": trace, "displayTimeUnit": "ms", "otherData": {"summary": self.summary()}}, f)
+            print(f"profil: {self.path}", file=sys.stderr)
+        except OSError as e: print(f"profil yazılamadı: {e}", file=sys.stderr)
+
+PROFILE = Profiler()
+
+def profiled(name):
+    # Süre ve çağrı sayısı PROFILE'a yazılır
+    def wrap(fn):
+        @wraps(fn)
+        def call(*args, **kwargs):
+            if not PROFILE.enabled: return fn(*args, **kwargs)
+            started = time.perf_counter()
+            try: return fn(*args, **kwargs)
+            finally: PROFILE.record(name, started)
+        return call
+    return wrap
+
+def row_ranges(rows):
+    # Satır numaralarını ardışık (ilk, son) aralıklarına ayır
+    first = last = None
+    for row in sorted(set(rows)):
+        if last is not None and row == last + 1: last = row; continue
+        if first is not None: yield first, last
+        first = last = row
+    if first is not None: yield first, last
+
+MP3_BITRATES = {(3, 3): (0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448),
+                (3, 2): (0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384),
+                (3, 1): (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+                (2, 3): (0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256),
+                (2, 2): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160)}
+ID3_FRAMES = {"TIT2": "title", "TPE1": "artist", "TALB": "album", "TT2": "title", "TP1": "artist", "TAL": "album"}
+VORBIS_FIELDS = {"TITLE": "title", "ARTIST": "artist", "ALBUM": "album"}
+MP4_FIELDS = {b"\xa9nam": "title", b"\xa9ART": "artist", b"\xa9alb": "album"}
+
+def id3_text(data):
+    if not data: return ""
+    enc, data = data[0], data[1:]
+    codec = ("latin-1", "utf-16", "utf-16-be", "utf-8")[enc] if enc < 4 else "latin-1"
+    return data.decode(codec, "replace").split("\x00")[0].strip()
+
+def parse_id3v2(f, info):
+    # ID3v2.2/2.3/2.4 başlık çerçeveleri; dönüş değeri ses verisinin başladığı konum
+    header = f.read(10)
+    if len(header) < 10 or header[:3] != b"ID3": f.seek(0); return 0
+    version, flags, size = header[3], header[5], syncsafe(header[6:10])
+    tag = f.read(size); pos = 0
+    if flags & 0x40 and version >= 3: pos = syncsafe(tag[:4]) if version == 4 else 4 + int.from_bytes(tag[:4], "big")
+    id_len, head_len = (3, 6) if version == 2 else (4, 10)
+    while pos + head_len <= len(tag):
+        frame_id = tag[pos:pos + id_len].decode("latin-1", "replace")
+        if not frame_id.strip("\x00"): break
+        raw = tag[pos + id_len:pos + id_len + (3 if version == 2 else 4)]
+        length = syncsafe(raw) if version == 4 else int.from_bytes(raw, "big")
+        if frame_id in ID3_FRAMES and not info.get(ID3_FRAMES[frame_id]):
+            info[ID3_FRAMES[frame_id]] = id3_text(tag[pos + head_len:pos + head_len + length])
+        pos += head_len + length
+    return 10 + size + (10 if flags & 0x10 else 0)
+
+def parse_mp3(f, info, file_size):
+    start = parse_id3v2(f, info); f.seek(start); buf = f.read(65536)
+    for i in range(len(buf) - 4):
+        if buf[i] != 0xFF or buf[i + 1] & 0xE0 != 0xE0: continue
+        version, layer = (buf[i + 1] >> 3) & 3, (buf[i + 1] >> 1) & 3
+        br_idx, sr_idx = buf[i + 2] >> 4, (buf[i + 2] >> 2) & 3
+        if version == 1 or layer == 0 or br_idx in (0, 15) or sr_idx == 3: continue
+        table = MP3_BITRATES[(3, layer)] if version == 3 else MP3_BITRATES[(2, 3 if layer == 3 else 2)]
+        rate = (44100, 48000, 32000)[sr_idx] >> (0 if version == 3 else 1 if version == 2 else 2)
+        mono = buf[i + 3] >> 6 == 3
+        spf = 384 if layer == 3 else 1152 if layer == 2 or version == 3 else 576
+        info["rate"] = rate; info["channels"] = 1 if mono else 2
+        audio = file_size - start - i
+        f.seek(-128, os.SEEK_END)
+        tail = f.read(128)
+        if tail[:3] == b"TAG":
+            audio -= 128
+            for key, field in (("title", tail[3:33]), ("artist", tail[33:63]), ("album", tail[63:93])):
+                if not info.get(key): info[key] = field.split(b"\x00")[0].decode("latin-1").strip()
+        # Xing/Info (LAME) ya da VBRI başlığı varsa gerçek kare sayısı ve bayt sayısı oradadır
+        side = (32 if not mono else 17) if version == 3 else (17 if not mono else 9)
+        frames = None; xing = buf[i + 4 + side:i + 4 + side + 16]; vbri = buf[i + 36:i + 36 + 18]
+        if xing[:4] in (b"Xing", b"Info"):
+            flags = int.from_bytes(xing[4:8], "big"); pos = 8
+            if flags & 1: frames = int.from_bytes(xing[pos:pos + 4], "big"); pos += 4
+            if flags & 2: audio = int.from_bytes(xing[pos:pos + 4], "big") or audio
+        elif vbri[:4] == b"VBRI":
+            audio = int.from_bytes(vbri[10:14], "big") or audio; frames = int.from_bytes(vbri[14:18], "big")
+        if frames: info["duration"] = frames * spf / rate
+        elif table[br_idx]: info["duration"] = audio * 8 / (table[br_idx] * 1000)
+        if info.get("duration"): info["bitrate"] = round(audio * 8 / info["duration"] / 1000)
+        return
+
+def parse_vorbis_comments(data, info):
+    try:
+        pos = 4 + int.from_bytes(data[:4], "little"); count = int.from_bytes(data[pos:pos + 4], "little"); pos += 4
+        for _ in range(count):
+            length = int.from_bytes(data[pos:pos + 4], "little"); pos += 4
+            key, _, value = data[pos:pos + length].decode("utf-8", "replace").partition("="); pos += length
+            field = VORBIS_FIELDS.get(key.upper())
+            if field and not info.get(field): info[field] = value.strip()
+            if pos >= len(data): break
+    except (IndexError, ValueError): pass
+
+def parse_flac(f, info, file_size):
+    start = parse_id3v2(f, info); f.seek(start)
+    if f.read(4) != b"fLaC": return
+    while True:
+        header = f.read(4)
+        if len(header) < 4: return
+        kind, length = header[0] & 0x7F, int.from_bytes(header[1:4], "big")
+        if kind == 0:
+            bits = int.from_bytes(f.read(length)[10:18], "big")
+            rate, total = bits >> 44, bits & 0xFFFFFFFFF
+            info["rate"] = rate; info["channels"] = ((bits >> 41) & 7) + 1
+            if rate and total: info["duration"] = total / rate
+        elif kind == 4: parse_vorbis_comments(f.read(length), info)
+        else: f.seek(length, os.SEEK_CUR)
+        if header[0] & 0x80: break
+    # Gömülü kapak resmi gibi meta blokları bit hızına katılmaz
+    if info.get("duration"): info["bitrate"] = round((file_size - f.tell()) * 8 / info["duration"] / 1000)
+
+def ogg_packets(f, count, limit=1 << 20):
+    # İlk `count` paketi sayfa bölüt tablolarından birleştirir; çok büyük paketler `limit` baytta kesilir
+    packets = []; packet = b""; size = 0
+    while len(packets) < count:
+        header = f.read(27)
+        if len(header) < 27 or header[:4] != b"OggS": break
+        table = f.read(header[26]); body = f.read(sum(table)); pos = 0
+        for seg in table:
+            if len(packet) < limit: packet += body[pos:pos + seg]
+            size += seg; pos += seg
+            if seg < 255: packets.append((packet, size)); packet = b""; size = 0
+    return packets
+
+def parse_ogg(f, info, file_size):
+    packets = ogg_packets(f, 2)
+    if len(packets) < 2: return
+    (head, _), (tags, tags_size) = packets
+    if head[:7] == b"\x01vorbis": info["channels"] = head[11]; info["rate"] = rate = int.from_bytes(head[12:16], "little"); skip = 0; parse_vorbis_comments(tags[7:], info)
+    elif head[:8] == b"OpusHead": info["channels"] = head[9]; info["rate"] = 48000; rate = 48000; skip = int.from_bytes(head[10:12], "little"); parse_vorbis_comments(tags[8:], info)
+    else: return
+    f.seek(max(0, file_size - 65536)); tail = f.read(); last = tail.rfind(b"OggS")
+    if last < 0 or not rate: return
+    granule = int.from_bytes(tail[last + 6:last + 14], "little", signed=True)
+    if granule > skip:
+        info["duration"] = (granule - skip) / rate
+        info["bitrate"] = round((file_size - tags_size) * 8 / info["duration"] / 1000)
+
+def mp4_atoms(f, start, end):
+    pos = start
+    while pos + 8 <= end:
+        f.seek(pos); header = f.read(8)
+        if len(header) < 8: return
+        size, kind = int.from_bytes(header[:4], "big"), header[4:8]; body = pos + 8
+        if size == 1: size = int.from_bytes(f.read(8), "big"); body += 8
+        elif size == 0: size = end - pos
+        if size < 8: return
+        yield kind, body, pos + size
+        pos += size
+
+def parse_mp4(f, info, file_size, start=0, end=None):
+    end = file_size if end is None else end
+    for kind, body, stop in mp4_atoms(f, start, end):
+        if kind in (b"moov", b"trak", b"mdia", b"minf", b"stbl", b"udta", b"ilst"): parse_mp4(f, info, file_size, body, stop)
+        elif kind == b"meta":
+            f.seek(body); peek = f.read(8)
+            parse_mp4(f, info, file_size, body if peek[4:8] == b"hdlr" else body + 4, stop)
+        elif kind == b"mvhd":
+            f.seek(body); data = f.read(32)
+            scale, length = (int.from_bytes(data[12:16], "big"), int.from_bytes(data[16:20], "big")) if data[0] == 0 else \
+                            (int.from_bytes(data[20:24], "big"), int.from_bytes(data[24:32], "big"))
+            if scale: info["duration"] = length / scale
+        elif kind == b"stsd" and not info.get("rate"):
+            f.seek(body + 16); entry = f.read(28)
+            if len(entry) == 28: info["channels"] = int.from_bytes(entry[16:18], "big"); info["rate"] = int.from_bytes(entry[24:26], "big")
+        elif kind == b"mdat": info["mdat"] = info.get("mdat", 0) + stop - body
+        elif kind in MP4_FIELDS:
+            f.seek(body); data = f.read(min(stop - body, 4096))
+            if data[4:8] == b"data": info[MP4_FIELDS[kind]] = data[16:int.from_bytes(data[:4], "big")].decode("utf-8", "replace").strip()
+    if start == 0 and info.get("duration") and info.get("mdat"): info["bitrate"] = round(info["mdat"] * 8 / info["duration"] / 1000)
+
+def parse_wav(f, info, file_size):
+    header = f.read(12)
+    if header[:4] != b"RIFF" or header[8:12] != b"WAVE": return
+    byte_rate = 0
+    for kind, body, stop in riff_chunks(f, 12, file_size):
+        f.seek(body)
+        if kind == b"fmt ":
+            data = f.read(16); info["channels"] = int.from_bytes(data[2:4], "little"); info["rate"] = int.from_bytes(data[4:8], "little")
+            byte_rate = int.from_bytes(data[8:12], "little"); info["bitrate"] = round(byte_rate * 8 / 1000)
+        elif kind == b"data" and byte_rate: info["duration"] = (stop - body) / byte_rate
+
+def riff_chunks(f, start, end):
+    pos = start
+    while pos + 8 <= end:
+        f.seek(pos); header = f.read(8)
+        if len(header) < 8: return
+        size = int.from_bytes(header[4:8], "little")
+        yield header[:4], pos + 8, min(pos + 8 + size, end)
+        pos += 8 + size + (size & 1)
+
+TAG_PARSERS = {".mp3": parse_mp3, ".mpga": parse_mp3, ".flac": parse_flac, ".ogg": parse_ogg, ".opus": parse_ogg,
+               ".m4a": parse_mp4, ".m4b": parse_mp4, ".wav": parse_wav}
+
+def read_metadata(path, file_size):
+    # Etiketleri ve akış başlığını dosyayı çözmeden okur: başlık, sanatçı, albüm, süre, gerçek bit hızı, örnekleme hızı, kanal
+    info = {}; parser = TAG_PARSERS.get(os.path.splitext(path)[1].lower())
+    if parser is None: return info
+    try:
+        with open(path, "rb") as f: parser(f, info, file_size)
+    except (OSError, ValueError, IndexError, KeyError): pass
+    info.pop("mdat", None)
+    return info
+
+META_KEYS = ("title", "artist", "album", "duration", "bitrate", "rate", "channels")
+
+def display_name(path, info):
+    if info and info.get("title"): return f"{info['artist']} - {info['title']}" if info.get("artist") else info["title"]
+    return os.path.basename(path)
+
+def playlist_entry(entry, base):
+    # Listedeki bir satırı yerel yola çevirir: file:// adresleri çözülür, göreli yollar listenin klasörüne göre; uzak adresler atlanır
+    entry = entry.strip()
+    if not entry: return None
+    if "://" in entry:
+        parts = urlsplit(entry)
+        if parts.scheme.lower() != "file": return None
+        entry = unquote(parts.path, errors="surrogateescape")
+    if os.sep == "/" and "\\" in entry and "/" not in entry: entry = entry.replace("\\", "/") # Windows'ta yazılmış liste
+    return os.path.normpath(os.path.join(base, os.path.expanduser(entry)))
+
+def read_playlist(path):
+    # Satır satır okunur, bellek kullanımı liste boyutundan bağımsızdır; yolların varlığı burada denetlenmez
+    base = os.path.dirname(os.path.abspath(path)); pls = path.lower().endswith(".pls")
+    try:
+        with open(path, "r", encoding="utf-8-sig", errors="surrogateescape") as f:
+            for line in f:
+                line = line.strip()
+                if pls:
+                    key, sep, value = line.partition("=")
+                    if not sep or not key.lower().startswith("file"): continue
+                    line = value
+                elif not line or line.startswith("#"): continue
+                entry = playlist_entry(line, base)
+                if entry and entry.lower().endswith(SUPPORTED_FORMATS): yield entry
+    except OSError: return
+
+def write_playlist(path, paths, info):
+    # Model doğrudan akıtılır (ara liste kurulmaz); listenin klasörü altındaki parçalar göreli yazılır
+    base = os.path.dirname(os.path.abspath(path)) + os.sep; pls = path.lower().endswith(".pls"); count = 0
+    def location(p): return p[len(base):] if p.startswith(base) else p
+    def m3u():
+        yield "#EXTM3U\n"
+        for p in paths:
+            meta = info(p) or {}; yield f"#EXTINF:{round(meta.get('duration') or -1)},{display_name(p, meta)}\n{location(p)}\n"
+    def playlist():
+        nonlocal count
+        yield "[playlist]\n"
+        for count, p in enumerate(paths, 1):
+            meta = info(p) or {}; yield f"File{count}={location(p)}\nTitle{count}={display_name(p, meta)}\nLength{count}={round(meta.get('duration') or -1)}\n"
+        yield f"NumberOfEntries={count}\nVersion=2\n"
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8", errors="surrogateescape") as f: f.writelines(playlist() if pls else m3u())
+    os.replace(tmp, path)
+
+TURKISH_UPPER = str.maketrans({"İ": "i", "I": "ı"})
+
+def turkish_fold(text):
+    # str.lower() "İ" harfini "i̇" (i + birleşik nokta), "I" harfini "i" yapar; Türkçe eşlemeler önce uygulanır
+    return text.translate(TURKISH_UPPER).lower()
+
+def format_duration(seconds):
+    h, rem = divmod(int(seconds), 3600); m, s = divmod(rem, 60)
+    return f"{h}:{m:02}:{s:02}" if h else f"{m:02}:{s:02}"
+
+class PlaylistModel(QAbstractListModel):
+    # Parçalar sadece yol listesi olarak tutulur; görünüm yalnızca ekrandaki satırları ister.
+    # known: yol kümesi, toplu eklemede kopyalar O(1) ile elenir. missing_color görünüm tarafından verilir (çekirdek QtGui yüklemez)
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.paths = []; self.known = set(); self.missing = set(); self.metadata = None; self.missing_color = None
+
+    def rowCount(self, parent=QModelIndex()): return 0 if parent.isValid() else len(self.paths)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid(): return None
+        path = self.paths[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole: return display_name(path, self.metadata.get(path) if self.metadata else None)
+        if role == Qt.ItemDataRole.UserRole: return path
+        if role == Qt.ItemDataRole.ToolTipRole: return f"{path} (bulunamadı)" if path in self.missing else path
+        if role == Qt.ItemDataRole.ForegroundRole and path in self.missing: return self.missing_color
+        return None
+
+    def path_at(self, row): return self.paths[row] if 0 <= row < len(self.paths) else None
+
+    def contains(self, path): return path in self.known
+
+    def insert_paths(self, paths, row=None):
+        known = self.known; paths = [p for p in dict.fromkeys(paths) if p not in known]
+        if not paths: return paths
+        row = len(self.paths) if row is None else max(0, min(row, len(self.paths)))
+        self.beginInsertRows(QModelIndex(), row, row + len(paths) - 1)
+        self.paths[row:row] = paths; known.update(paths)
+        self.endInsertRows()
+        return paths
+
+    def remove_rows(self, rows):
+        # Sondan başa, her ardışık aralık için tek bir beginRemoveRows
+        for first, last in reversed(list(row_ranges(r for r in rows if 0 <= r < len(self.paths)))):
+            self.beginRemoveRows(QModelIndex(), first, last)
+            self.known.difference_update(self.paths[first:last + 1]); del self.paths[first:last + 1]
+            self.endRemoveRows()
+
+    def set_paths(self, paths):
+        self.beginResetModel(); self.paths = list(dict.fromkeys(paths)); self.known = set(self.paths); self.endResetModel()
+
+    def clear(self): self.set_paths([])
+
+    def refresh(self):
+        if self.paths: self.dataChanged.emit(self.index(0), self.index(len(self.paths) - 1), [Qt.ItemDataRole.DisplayRole])
+
+    def rename_paths(self, renamed):
+        # Yeniden adlandırılan dosyalar yerinde güncellenir; satır sırası ve çalma sırası korunur
+        renamed = {old: new for old, new in renamed.items() if old in self.known and new not in self.known}
+        if not renamed: return False
+        changed = [row for row, path in enumerate(self.paths) if path in renamed]
+        for row in changed: self.paths[row] = renamed[self.paths[row]]
+        self.known.difference_update(renamed); self.known.update(renamed.values())
+        for first, last in row_ranges(changed): self.dataChanged.emit(self.index(first), self.index(last))
+        return bool(changed)
+
+    def mark_missing(self, paths):
+        self.missing.update(paths)
+        if self.paths: self.dataChanged.emit(self.index(0), self.index(len(self.paths) - 1), [Qt.ItemDataRole.ForegroundRole, Qt.ItemDataRole.ToolTipRole])
+
+class PlayOrder:
+    # Çalma sırası: tembel Fisher–Yates karıştırma torbası, geri/ileri geçmiş yığını ve "sıradaki" kuyruğu.
+    # Torbada [0, k) konumları bu turda çalınmış, [k, n) konumları bekleyen satırlardır; yalnızca kimlik dışı konumlar saklanır.
+    # sequence: sıralı görünüm varsa (sıra, satır -> konum) döndüren çağrı; karıştırma kapalıyken ileri/geri bu sırayı izler
+    saved_limit = 4096
+
+    def __init__(self, count=0):
+        self.rng = random.Random(); self.sequence = None; self.reset(count)
+
+    def reset(self, count):
+        self.n = count; self.k = 0; self.pos = {}; self.where = {}
+        self.history = []; self.cursor = -1; self.queue = deque(); self.pending = None
+
+    def get(self, i): return self.pos.get(i, i)
+
+    def put(self, i, value):
+        if i == value: self.pos.pop(i, None); self.where.pop(value, None)
+        else: self.pos[i] = value; self.where[value] = i
+
+    def swap(self, i, j):
+        a, b = self.get(i), self.get(j); self.put(i, b); self.put(j, a)
+
+    def step(self, current, delta):
+        ranked = self.sequence() if self.sequence is not None else None
+        if not ranked: return (current + delta) % self.n
+        order, rank = ranked; i = rank.get(current)
+        if i is None: return order[0] if delta > 0 else order[-1]
+        return order[(i + delta) % len(order)]
+
+    def mark_played(self, row):
+        p = self.where.get(row, row)
+        if self.k <= p < self.n: self.swap(p, self.k); self.k += 1
+
+    def draw(self, avoid=-1):
+        if self.k >= self.n:
+            self.k = 0 # tur bitti; az önce çalanı yeni turun başında tekrar çekme
+            if self.n > 1: self.mark_played(avoid)
+        j = self.rng.randrange(self.k, self.n); self.swap(j, self.k); self.k += 1
+        return self.get(self.k - 1)
+
+    def visit(self, row):
+        # Hangi yoldan çalınırsa çalınsın satır geçmişe yazılır ve bu turda çalınmış sayılır
+        if not (0 <= self.cursor < len(self.history) and self.history[self.cursor] == row):
+            del self.history[self.cursor + 1:]; self.history.append(row)
+            if len(self.history) > 1000: del self.history[:-1000]
+            self.cursor = len(self.history) - 1
+        self.mark_played(row)
+
+    def peek(self, current, shuffle):
+        # Sıradaki satırı tüketmeden döndürür; karıştırmada çekilen satır next() için saklanır
+        if self.cursor + 1 < len(self.history): return self.history[self.cursor + 1]
+        if self.queue: return self.queue[0]
+        if shuffle:
+            if self.pending is None: self.pending = self.draw(current)
+            return self.pending
+        return self.step(current, 1)
+
+    def next(self, current, shuffle):
+        if self.cursor + 1 < len(self.history): self.cursor += 1; return self.history[self.cursor]
+        if self.queue: return self.queue.popleft()
+        if shuffle:
+            row = self.pending if self.pending is not None else self.draw(current); self.pending = None
+            return row
+        return self.step(current, 1)
+
+    def prev(self, current, shuffle):
+        if self.cursor > 0: self.cursor -= 1; return self.history[self.cursor]
+        return self.step(current, -1)
+
+    def enqueue(self, rows): self.queue.extend(r for r in rows if 0 <= r < self.n)
+
+    def insert(self, first, count):
+        if first >= self.n: self.n += count; return # sona ekleme: yeni konumlar zaten kimlik eşlemesinde
+        self.remap(lambda r: r + count if r >= first else r, range(first, first + count))
+
+    def remove(self, rows):
+        # Silinen satırların tümü tek geçişte; çoklu seçim, kütüphane ve kopya silmeleri aralık başına torbayı yeniden kurmaz
+        rows = sorted({r for r in rows if 0 <= r < self.n})
+        if not rows: return
+        gone = set(rows)
+        self.remap(lambda r: None if r in gone else r - bisect_left(rows, r), (), len(rows))
+
+    def remap(self, shift, added, removed=0):
+        # Ortadan ekleme/silme: çalınmış/bekleyen ayrımı korunur, yeniden karıştırılmaz. Torbaya bu turda hiç
+        # dokunulmamışsa (kimlik eşlemesi) yalnızca boyut değişir
+        if self.k or self.pos:
+            values = [self.get(i) for i in range(self.n)]
+            drawn = [r for r in map(shift, values[:self.k]) if r is not None]
+            waiting = [r for r in map(shift, values[self.k:]) if r is not None] + list(added)
+            self.pos = {}; self.where = {}; self.n = len(drawn) + len(waiting); self.k = len(drawn)
+            for i, r in enumerate(drawn + waiting): self.put(i, r)
+        else: self.n += len(added) - removed
+        history = [(shift(r), i <= self.cursor) for i, r in enumerate(self.history)]
+        self.history = [r for r, _ in history if r is not None]
+        self.cursor = sum(1 for r, before in history if r is not None and before) - 1
+        self.queue = deque(r for r in map(shift, self.queue) if r is not None)
+        if self.pending is not None: self.pending = shift(self.pending)
+
+    def state(self):
+        # Yer değiştirmiş konumlar sınırı aşarsa torba kaydedilmez (ayar dosyası büyümez); açılışta tur baştan başlar
+        if len(self.pos) > self.saved_limit: return {"n": self.n, "k": 0, "pos": [], "history": self.history[-200:]}
+        return {"n": self.n, "k": self.k, "pos": list(self.pos.items()), "history": self.history[-200:]}
+
+    def restore(self, state, count):
+        # Kayıtlı torba yalnızca liste uzunluğu tutuyorsa kullanılır; aksi halde torba sıfırdan (tembel) başlar
+        try:
+            if not state or state["n"] != count: return
+            self.reset(count); self.k = min(max(0, int(state["k"])), count)
+            for i, r in state["pos"]:
+                if 0 <= i < count and 0 <= r < count: self.put(int(i), int(r))
+            if len(self.where) != len(self.pos): self.reset(count); return
+            self.history = [r for r in state.get("history", []) if isinstance(r, int) and 0 <= r < count]; self.cursor = len(self.history) - 1
+        except (KeyError, TypeError, ValueError): self.reset(count)
+
+class PlaylistStore:
+    # Çalma listesi ayarlardan ayrı, sıra numarasıyla indekslenmiş tek tabloluk bir SQLite dosyasında tutulur
+    def __init__(self, path): self.path = path
+
+    def connect(self):
+        db = sqlite3.connect(self.path)
+        db.execute("CREATE TABLE IF NOT EXISTS tracks (pos INTEGER PRIMARY KEY, path TEXT NOT NULL)")
+        return db
+
+    def load(self):
+        # Tek toplu okuma; dosya yoksa None döner (eski yapılandırmadan taşıma için)
+        if not os.path.exists(self.path): return None
+        try:
+            with closing(self.connect()) as db: return [row[0] for row in db.execute("SELECT path FROM tracks ORDER BY pos")]
+        except sqlite3.Error: return None
+
+    def save(self, paths):
+        try:
+            with closing(self.connect()) as db, db:
+                db.execute("DELETE FROM tracks"); db.executemany("INSERT INTO tracks VALUES (?, ?)", enumerate(paths))
+        except sqlite3.Error: pass
+
+class PathValidator(QObject):
+    # Yolların varlığı arka planda kontrol edilir; uyuyan USB diskler ve NFS açılışı bekletmez
+    missingFound = pyqtSignal(list)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.generation = 0
+
+    def start(self, paths):
+        self.generation += 1
+        threading.Thread(target=self.run, args=(list(paths), self.generation), daemon=True).start()
+
+    def stop(self): self.generation += 1
+
+    def run(self, paths, generation):
+        missing = []; last = time.monotonic()
+        for path in paths:
+            if generation != self.generation: return
+            if not os.path.exists(path): missing.append(path)
+            if missing and time.monotonic() - last > 0.25: self.missingFound.emit(missing); missing = []; last = time.monotonic()
+        if missing: self.missingFound.emit(missing)
+
+class MetadataCache(QObject):
+    # Her dosya bir kez ayrıştırılır; sonuçlar (yol, mtime, boyut) anahtarıyla SQLite'ta, sıcak yol için bellekte tutulur
+    infoReady = pyqtSignal(list)
+
+    def __init__(self, path, parent=None):
+        super().__init__(parent)
+        self.path = path; self.items = {}; self.queue = queue.Queue(); self.thread = None
+
+    def get(self, path): return self.items.get(path)
+
+    def request(self, paths):
+        paths = [p for p in paths if p not in self.items]
+        if not paths: return
+        self.queue.put(paths)
+        if self.thread is None: self.thread = threading.Thread(target=self.run, daemon=True); self.thread.start()
+
+    def stop(self):
+        if self.thread is not None: self.queue.put(None)
+
+    def run(self):
+        known = {}; db = None
+        try:
+            db = sqlite3.connect(self.path)
+            db.execute("CREATE TABLE IF NOT EXISTS tracks (path TEXT PRIMARY KEY, mtime REAL, size INTEGER, title TEXT, artist TEXT, "
+                       "album TEXT, duration REAL, bitrate INTEGER, rate INTEGER, channels INTEGER)")
+            known = {row[0]: row[1:] for row in db.execute("SELECT * FROM tracks")}
+        except sqlite3.Error: pass
+        while True:
+            paths = self.queue.get()
+            if paths is None: break
+            ready = []; fresh = []
+            for path in paths:
+                if path in self.items: continue
+                try: st = os.stat(path)
+                except OSError: continue
+                row = known.get(path)
+                if row is None or row[0] != st.st_mtime or row[1] != st.st_size:
+                    info = read_metadata(path, st.st_size)
+                    row = known[path] = (st.st_mtime, st.st_size) + tuple(info.get(key) for key in META_KEYS); fresh.append((path,) + row)
+                self.items[path] = dict(zip(("mtime", "size") + META_KEYS, row)); ready.append(path)
+                if len(ready) >= 500: self.flush(db, ready, fresh); ready = []; fresh = []
+            self.flush(db, ready, fresh)
+        if db is not None: db.close()
+
+    def flush(self, db, ready, fresh):
+        if fresh and db is not None:
+            try:
+                with db: db.executemany("INSERT OR REPLACE INTO tracks VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", fresh)
+            except sqlite3.Error: pass
+        if ready: self.infoReady.emit(ready)
+
+class SettingsStore(QObject):
+    # Kayıt isteklerini kısa bir pencerede birleştirir; yazma arka plan iş parçacığında geçici dosya + rename ile yapılır
+    def __init__(self, path, collect, playlist, delay=500, parent=None):
+        super().__init__(parent)
+        self.path = path; self.collect = collect; self.playlist = playlist
+        self.playlists = PlaylistStore(PLAYLIST_FILE); self.playlist_changed = False
+        self.writer = ThreadPoolExecutor(max_workers=1)
+        self.timer = QTimer(self); self.timer.setSingleShot(True); self.timer.setInterval(delay); self.timer.timeout.connect(self.flush)
+
+    def mark_dirty(self):
+        if not self.timer.isActive(): self.timer.start()
+
+    def mark_playlist_dirty(self, *args): self.playlist_changed = True; self.mark_dirty()
+
+    @profiled("settings.flush")
+    def flush(self, wait=False):
+        self.timer.stop()
+        paths = list(self.playlist()) if self.playlist_changed else None; self.playlist_changed = False
+        future = self.writer.submit(self.write, self.collect(), paths)
+        if wait: future.result()
+
+    @profiled("settings.write")
+    def write(self, data, paths):
+        # Yazıcı iş parçacığında: liste (değiştiyse) + JSON + fsync
+        if paths is not None: self.playlists.save(paths)
+        text = json.dumps(data, ensure_ascii=False)
+        tmp = self.path + ".tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as f: f.write(text); f.flush(); os.fsync(f.fileno())
+            os.replace(tmp, self.path)
+        except OSError: pass
+
+    def close(self): self.flush(wait=True); self.writer.shutdown()
+
+class LibraryScanner(QObject):
+    # Bırakılan klasör/dosyaları arka planda os.scandir ile tarar, sonuçları toplu eklemek için parça parça gönderir
+    chunkFound = pyqtSignal(list)
+    progress = pyqtSignal(int, float) # bulunan dosya sayısı, dosya/sn
+    finished = pyqtSignal(int)
+    rawChunk = pyqtSignal(list, int)
+
+    def __init__(self, parent=None, chunk_size=1000):
+        super().__init__(parent)
+        self.chunk_size = chunk_size; self.generation = 0; self.roots = deque(); self.thread = None; self.lock = threading.Lock()
+        self.rawChunk.connect(self.deliver) # GUI iş parçacığında çalışır; iptalden sonra gelen parçalar atılır
+
+    def is_running(self): return self.thread is not None
+
+    def scan(self, paths):
+        with self.lock:
+            self.roots.extend(paths)
+            if self.thread is not None: return
+            self.thread = threading.Thread(target=self.run, args=(self.generation,), daemon=True); self.thread.start()
+
+    def cancel(self):
+        with self.lock: self.generation += 1; self.roots.clear(); self.thread = None
+
+    def deliver(self, paths, generation):
+        if generation == self.generation: self.chunkFound.emit(paths)
+
+    def run(self, generation):
+        found = []; total = 0; seen = set(); start = last = time.monotonic()
+        while True:
+            with self.lock:
+                if generation != self.generation: return
+                if not self.roots: self.thread = None; break
+                root = self.roots.popleft()
+            for path in self.walk(root, seen, generation):
+                found.append(path); total += 1; now = time.monotonic()
+                if len(found) >= self.chunk_size or now - last > 0.2:
+                    self.rawChunk.emit(found, generation); found = []; last = now
+                    self.progress.emit(total, total / max(now - start, 1e-6))
+        if found: self.rawChunk.emit(found, generation)
+        self.finished.emit(total)
+
+    def walk(self, root, seen, generation):
+        if not os.path.isdir(root):
+            if root.lower().endswith(PLAYLIST_FORMATS):
+                for path in read_playlist(root):
+                    if generation != self.generation: return
+                    yield path
+            elif root.lower().endswith(SUPPORTED_FORMATS): yield root
+            return
+        stack = [root]
+        while stack:
+            if generation != self.generation: return
+            folder = stack.pop()
+            try:
+                st = os.stat(folder)
+                if (st.st_dev, st.st_ino) in seen: continue # sembolik bağ döngüsü
+                seen.add((st.st_dev, st.st_ino))
+                with os.scandir(folder) as it: entries = sorted(it, key=lambda e: e.name)
+            except OSError: continue
+            subdirs = []
+            for entry in entries:
+                try:
+                    if entry.is_dir(): subdirs.append(entry.path)
+                    elif entry.name.lower().endswith(SUPPORTED_FORMATS): yield entry.path
+                except OSError: pass
+            stack.extend(reversed(subdirs))
+
+class DuplicateFinder(QObject):
+    # İsteğe bağlı içerik parmak izi: önce ses bölgesi uzunlukları, yalnızca uzunluğu çakışanlar için örneklenmiş özet.
+    # İki adım da süreç havuzunda paralel çalışır; sonuç, aynı kaydı gösteren yol grupları olarak gelir
+    found = pyqtSignal(list)
+    progress = pyqtSignal(int, int)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.generation = 0; self.running = False
+
+    def start(self, paths):
+        self.generation += 1; self.running = True
+        threading.Thread(target=self.run, args=(list(paths), self.generation), daemon=True).start()
+
+    def stop(self): self.generation += 1; self.running = False
+
+    def run(self, paths, generation):
+        groups = []
+        try:
+            # spawn: Qt iş parçacıkları olan süreç fork edilmez
+            with ProcessPoolExecutor(max_workers=max(1, min(8, os.cpu_count() or 1)), mp_context=multiprocessing.get_context("spawn")) as pool:
+                by_length = {}; done = 0
+                for path, start, length in pool.map(audio_span, paths, chunksize=256):
+                    if generation != self.generation: pool.shutdown(cancel_futures=True); return
+                    if length >= 0: by_length.setdefault(length, []).append((path, start, length))
+                    done += 1
+                    if done % 1000 == 0: self.progress.emit(done, len(paths))
+                jobs = [job for group in by_length.values() if len(group) > 1 for job in group]
+                by_hash = {}
+                for path, digest in pool.map(sampled_hash, jobs, chunksize=16):
+                    if generation != self.generation: pool.shutdown(cancel_futures=True); return
+                    if digest is not None: by_hash.setdefault(digest, []).append(path)
+                groups = [group for group in by_hash.values() if len(group) > 1]
+        finally: # dosya kaybolması, izin ya da havuz hatasında da bulucu yeniden çalışabilmeli
+            if generation == self.generation: self.running = False; self.found.emit(groups)
+
+def pair_renames(added, removed):
+    # Aynı adlı tek aday = taşıma/klasör adı değişimi; bir klasörde tek silinen + tek eklenen = dosya adı değişimi
+    by_name = {}
+    for path in removed: by_name.setdefault(os.path.basename(path), []).append(path)
+    renamed = {}; rest = []
+    for path in added:
+        olds = by_name.get(os.path.basename(path))
+        if olds is not None and len(olds) == 1 and olds[0] not in renamed: renamed[olds[0]] = path
+        else: rest.append(path)
+    left = [path for path in removed if path not in renamed]; gone = {}; new = {}
+    for path in left: gone.setdefault(os.path.dirname(path), []).append(path)
+    for path in rest: new.setdefault(os.path.dirname(path), []).append(path)
+    for folder, olds in gone.items():
+        news = new.get(folder)
+        if len(olds) == 1 and news is not None and len(news) == 1: renamed[olds[0]] = news[0]
+    paired = set(renamed.values())
+    return [p for p in rest if p not in paired], [p for p in left if p not in renamed], [[old, path] for old, path in renamed.items()]
+
+class LibraryWatcher(QObject):
+    # Kayıtlı kütüphane klasörleri. Açılışta klasör mtime'ları saklanan anlık görüntüyle karşılaştırılır: mtime'ı değişmemiş
+    # bir klasörün dosya ve alt klasör adları görüntüden alınır, yalnızca değişenler yeniden okunur. Sonrasında
+    # QFileSystemWatcher (inotify) bildirimleriyle yalnızca bildirilen klasörler okunup fark listeye uygulanır.
+    changed = pyqtSignal(list, list, list) # eklenen, silinen, [eski, yeni] yeniden adlandırılan yollar
+    watchChanged = pyqtSignal(list, list) # izlenecek, bırakılacak klasörler
+    syncing = pyqtSignal(bool)
+
+    def __init__(self, path, parent=None, chunk_size=1000, delay=300):
+        super().__init__(parent)
+        self.path = path; self.chunk_size = chunk_size; self.roots = []; self.dirs = {}; self.queue = queue.Queue(); self.thread = None; self.stopped = False
+        self.watcher = QFileSystemWatcher(self); self.watcher.directoryChanged.connect(self.directory_changed); self.watched = set(); self.pending = set()
+        self.timer = QTimer(self); self.timer.setSingleShot(True); self.timer.setInterval(delay); self.timer.timeout.connect(self.flush_pending)
+        self.watchChanged.connect(self.update_watch) # QFileSystemWatcher yalnızca GUI iş parçacığından değiştirilir
+
+    def start(self, roots):
+        self.roots[:] = [os.path.normpath(r) for r in roots if isinstance(r, str)]
+        if self.roots: self.submit(("sync", list(self.roots), list(self.roots)))
+
+    def add_root(self, root):
+        # İç içe kökler tek kökte birleşir; zaten kapsanan klasör yeniden eklenmez
+        root = os.path.normpath(os.path.abspath(root))
+        if any(root == r or root.startswith(r + os.sep) for r in self.roots): return False
+        self.roots[:] = [r for r in self.roots if not r.startswith(root + os.sep)] + [root]
+        self.submit(("sync", [root], list(self.roots))); return True
+
+    def remove_root(self, root):
+        if root in self.roots: self.roots.remove(root); self.submit(("forget", [root], list(self.roots)))
+
+    def directory_changed(self, path):
+        self.pending.add(path)
+        if not self.timer.isActive(): self.timer.start() # aynı klasördeki olay seli tek okumada birleşir
+
+    def flush_pending(self):
+        if self.pending: self.submit(("dirs", sorted(self.pending), list(self.roots))); self.pending = set()
+
+    def submit(self, job):
+        self.queue.put(job)
+        if self.thread is None: self.thread = threading.Thread(target=self.run, daemon=True); self.thread.start()
+
+    def stop(self):
+        self.stopped = True
+        if self.thread is not None: self.queue.put(None)
+
+    def update_watch(self, add, remove):
+        remove = [p for p in remove if p in self.watched]; add = [p for p in add if p not in self.watched]
+        if remove: self.watcher.removePaths(remove); self.watched.difference_update(remove)
+        if add:
+            failed = set(self.watcher.addPaths(add)); self.watched.update(p for p in add if p not in failed)
+            if failed: print(f"kütüphane: {len(failed)} klasör izlenemiyor (fs.inotify.max_user_watches?)", file=sys.stderr)
+
+    def run(self):
+        db = None
+        try:
+            db = sqlite3.connect(self.path)
+            db.execute("CREATE TABLE IF NOT EXISTS dirs (path TEXT PRIMARY KEY, mtime INTEGER, subdirs TEXT, files TEXT)")
+            self.dirs = {row[0]: (row[1], tuple(json.loads(row[2])), tuple(json.loads(row[3]))) for row in db.execute("SELECT * FROM dirs")}
+        except (sqlite3.Error, ValueError): pass
+        while True:
+            job = self.queue.get()
+            if job is None or self.stopped: break
+            kind, folders, roots = job
+            if kind == "forget": self.forget(db, folders[0], roots); continue
+            if kind == "sync": self.syncing.emit(True)
+            self.sync(db, folders, roots, kind == "sync")
+            if kind == "sync": self.syncing.emit(False)
+        if db is not None: db.close()
+
+    def sync(self, db, starts, roots, deep):
+        added = []; removed = []; dropped = []; updates = []; watch = []; seen = set()
+        stack = list(reversed(starts)); starts = set(starts); roots = set(roots)
+        if not deep: stack = [f for f in stack if f in self.dirs and any(f == r or f.startswith(r + os.sep) for r in roots)]
+        while stack:
+            if self.stopped: return
+            folder = stack.pop(); old = self.dirs.get(folder)
+            try:
+                st = os.stat(folder)
+                if (st.st_dev, st.st_ino) in seen: continue # sembolik bağ döngüsü
+                seen.add((st.st_dev, st.st_ino))
+                if old is not None and old[0] == st.st_mtime_ns and (deep or folder not in starts): subdirs, files = old[1], old[2]
+                else:
+                    subdirs = []; files = []
+                    with os.scandir(folder) as it: entries = sorted(it, key=lambda e: e.name)
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(): subdirs.append(entry.name)
+                            elif entry.name.lower().endswith(SUPPORTED_FORMATS): files.append(entry.name)
+                        except OSError: pass
+                    subdirs = tuple(subdirs); files = tuple(files)
+            except OSError: continue # kök bağlı değil ya da erişilemiyor: görüntü olduğu gibi kalır
+            if folder in roots and old is not None and (old[1] or old[2]) and not (subdirs or files): continue # boş bağlama noktası
+            if old is None or old != (st.st_mtime_ns, subdirs, files):
+                before = set(old[2]) if old else set(); now = set(files)
+                added += [os.path.join(folder, n) for n in files if n not in before]
+                if old is not None:
+                    removed += [os.path.join(folder, n) for n in old[2] if n not in now]
+                    kept = set(subdirs); dropped += [os.path.join(folder, n) for n in old[1] if n not in kept]
+                self.dirs[folder] = (st.st_mtime_ns, subdirs, files); updates.append(folder)
+            if deep or old is None: watch.append(folder)
+            children = subdirs if deep or old is None else [n for n in subdirs if n not in old[1]]
+            stack.extend(os.path.join(folder, n) for n in reversed(children))
+            if len(added) >= self.chunk_size and not removed and not dropped: self.changed.emit(added, [], []); added = []
+        unwatch = []
+        while dropped: # silinen ya da taşınan alt ağaçlar
+            folder = dropped.pop(); entry = self.dirs.pop(folder, None)
+            if entry is None: continue
+            removed += [os.path.join(folder, n) for n in entry[2]]; dropped += [os.path.join(folder, n) for n in entry[1]]; unwatch.append(folder)
+        added, removed, renamed = pair_renames(added, removed)
+        if added or removed or renamed: self.changed.emit(added, removed, renamed)
+        if watch or unwatch: self.watchChanged.emit(watch, unwatch)
+        self.save(db, updates, unwatch)
+
+    def forget(self, db, root, roots):
+        # Kök bırakılınca izleme ve görüntü silinir; listedeki parçalara dokunulmaz
+        if any(root.startswith(r + os.sep) for r in roots): return
+        gone = [f for f in self.dirs if (f == root or f.startswith(root + os.sep)) and not any(f == r or f.startswith(r + os.sep) for r in roots)]
+        for folder in gone: del self.dirs[folder]
+        if gone: self.watchChanged.emit([], gone)
+        self.save(db, [], gone)
+
+    def save(self, db, updates, gone):
+        if db is None or not (updates or gone): return
+        try:
+            with db:
+                db.executemany("INSERT OR REPLACE INTO dirs VALUES (?, ?, ?, ?)",
+                               [(f, self.dirs[f][0], json.dumps(self.dirs[f][1], ensure_ascii=False), json.dumps(self.dirs[f][2], ensure_ascii=False)) for f in updates if f in self.dirs])
+                db.executemany("DELETE FROM dirs WHERE path = ?", [(f,) for f in gone])
+        except sqlite3.Error: pass
+
+def buffer_samples(buffer):
+    # QAudioBuffer -> ((kare, kanal) float32 dizi, örnekleme hızı); desteklenmeyen biçimde None
+    fmt = buffer.format(); channels = max(1, fmt.channelCount())
+    kind = {QAudioFormat.SampleFormat.Int16: (np.int16, 32768.0, 0), QAudioFormat.SampleFormat.Int32: (np.int32, 2147483648.0, 0),
+            QAudioFormat.SampleFormat.Float: (np.float32, 1.0, 0), QAudioFormat.SampleFormat.UInt8: (np.uint8, 128.0, 128)}.get(fmt.sampleFormat())
+    if kind is None or buffer.byteCount() <= 0: return None
+    dtype, scale, bias = kind
+    raw = np.frombuffer(buffer.constData().asstring(buffer.byteCount()), dtype)
+    raw = raw[:raw.size - raw.size % channels].reshape(-1, channels)
+    samples = raw.astype(np.float32) if bias == 0 and scale == 1.0 else (raw.astype(np.float32) - bias) / scale
+    return samples, fmt.sampleRate()
+
+REFERENCE_LUFS = -18.0 # ReplayGain 2.0
+def gain_factor(lufs, peak):
+    # Hedef -18 LUFS; kazanç, tepe 0 dBFS'i aşmayacak şekilde sınırlanır
+    if lufs is None: return 1.0
+    gain = REFERENCE_LUFS - lufs
+    if peak > 0: gain = min(gain, -20 * math.log10(peak))
+    return 10 ** (gain / 20)
+
+class LoudnessAnalyzer(QObject):
+    # Parça başına kazanç tablosu. Sonuçlar (yol, mtime, boyut) anahtarıyla SQLite'ta; oynatma yalnızca bellekteki sözlüğe bakar.
+    # Analiz düşük öncelikli bir süreç havuzunda, işçi sayısının iki katıyla sınırlı bekleyen işle yürür;
+    # her 50 sonuçta kaydedilir, durdurulan ya da yarıda kalan iş bir sonraki başlatmada kaldığı yerden sürer
+    gainsReady = pyqtSignal(dict) # yol -> doğrusal kazanç
+    progress = pyqtSignal(int, int, float) # biten, toplam, parça/sn
+    finished = pyqtSignal(int, float) # analiz edilen parça, süre (sn)
+
+    def __init__(self, path, parent=None):
+        super().__init__(parent)
+        self.path = path; self.workers = max(1, (os.cpu_count() or 2) // 2); self.gains = {}
+        self.generation = 0; self.running = False; self.resume = threading.Event(); self.resume.set()
+        self.gainsReady.connect(self.merge)
+
+    def merge(self, gains): self.gains.update(gains)
+
+    def factor(self, path): return self.gains.get(path, 1.0)
+
+    def state(self): return "idle" if not self.running else "running" if self.resume.is_set() else "paused"
+
+    def connect(self):
+        db = sqlite3.connect(self.path)
+        db.execute("CREATE TABLE IF NOT EXISTS gains (path TEXT PRIMARY KEY, mtime REAL, size INTEGER, lufs REAL, peak REAL)")
+        return db
+
+    def load(self): threading.Thread(target=self.read_table, daemon=True).start()
+
+    def read_table(self):
+        try:
+            with closing(self.connect()) as db: self.gainsReady.emit({row[0]: gain_factor(row[1], row[2] or 0.0) for row in db.execute("SELECT path, lufs, peak FROM gains")})
+        except sqlite3.Error: pass
+
+    def start(self, paths):
+        if self.running: return
+        self.generation += 1; self.running = True; self.resume.set()
+        threading.Thread(target=self.run, args=(list(paths), self.generation), daemon=True).start()
+
+    def pause(self): self.resume.clear()
+    def unpause(self): self.resume.set()
+    def stop(self): self.generation += 1; self.running = False; self.resume.set()
+
+    def run(self, paths, generation):
+        done = 0; started = time.monotonic()
+        try:
+            with closing(self.connect()) as db:
+                known = {row[0]: (row[1], row[2]) for row in db.execute("SELECT path, mtime, size FROM gains")}
+                todo = {}
+                for path in paths:
+                    if generation != self.generation: return
+                    try: st = os.stat(path)
+                    except OSError: continue
+                    if known.get(path) != (st.st_mtime, st.st_size): todo[path] = (st.st_mtime, st.st_size)
+                jobs = iter(list(todo)); pending = set(); batch = []; last = started
+                with ProcessPoolExecutor(self.workers, mp_context=multiprocessing.get_context("spawn"), initializer=lower_priority) as pool:
+                    while generation == self.generation:
+                        while len(pending) < self.workers * 2:
+                            self.resume.wait() # duraklatıldıysa yeni iş verilmez
+                            path = next(jobs, None) if generation == self.generation else None
+                            if path is None: break
+                            pending.add(pool.submit(measure_loudness, path))
+                        if not pending: break
+                        finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in finished:
+                            done += 1
+                            try: path, lufs, peak = future.result()
+                            except Exception: continue # bozuk dosya çözücüyü düşürdüyse sonraki başlatmada yeniden denenir
+                            batch.append((path,) + todo[path] + (lufs, peak))
+                        now = time.monotonic()
+                        if len(batch) >= 50 or now - last > 2: self.save(db, batch); batch = []; last = now; self.progress.emit(done, len(todo), done / max(now - started, 1e-6))
+                    if generation != self.generation: pool.shutdown(cancel_futures=True)
+                self.save(db, batch)
+        except sqlite3.Error: pass
+        finally:
+            if generation == self.generation: self.running = False; self.finished.emit(done, time.monotonic() - started)
+
+    def save(self, db, rows):
+        if not rows: return
+        try:
+            with db: db.executemany("INSERT OR REPLACE INTO gains VALUES (?, ?, ?, ?, ?)", rows)
+        except sqlite3.Error: return
+        self.gainsReady.emit({row[0]: gain_factor(row[3], row[4]) for row in rows})
+
+def command_int(value):
+    # Komutlardaki sayılar: bool, sonsuz ve sayıya çevrilemeyen değerler ValueError olarak reddedilir
+    if isinstance(value, bool) or not isinstance(value, (int, float, str)): raise ValueError(f"sayı bekleniyor: {value!r}")
+    try: return int(value)
+    except (ValueError, OverflowError): raise ValueError(f"sayı bekleniyor: {value!r}") from None
+
+def parse_command(line):
+    # Düz metin komut: "next", "seek 30000", "seek -5000", "volume 40", "enqueue '/yol/parça.mp3'"
+    words = shlex.split(line)
+    if not words: raise ValueError("boş komut")
+    cmd = words[0]; args = words[1:]
+    if cmd in ("open", "add", "enqueue"): return {"cmd": cmd, "paths": args}
+    if cmd in ("seek", "volume"):
+        if len(args) != 1: raise ValueError(f"{cmd} tek bir sayı bekler")
+        value = command_int(args[0])
+        if cmd == "volume": return {"cmd": cmd, "value": value}
+        return {"cmd": cmd, "delta": value} if args[0].startswith(("+", "-")) else {"cmd": cmd, "ms": value}
+    return {"cmd": cmd}
+
+class CommandServer(QObject):
+    # Tek örnek sunucusu ve yerel soket komutları. Her satır bir istek: JSON nesnesi, toplu istek için JSON dizisi
+    # ya da düz metin; her satıra tek bir JSON satırıyla yanıt verilir (dizi isteğe dizi yanıt)
+    def __init__(self, name, handler, parent=None):
+        super().__init__(parent)
+        self.name = name; self.handler = handler; self.server = QLocalServer(self)
+        self.server.setSocketOptions(QLocalServer.SocketOption.UserAccessOption); self.server.newConnection.connect(self.accept)
+
+    def listen(self):
+        # UserAccessOption ile listen var olan soketin üzerine yazar; bu yüzden önce bağlanılır. Canlı bir örnek
+        # (--new-instance, yarış) yanıt veriyorsa soketine dokunulmaz; bağlantı kurulamazsa kalan dosya temizlenir
+        probe = QLocalSocket(); probe.connectToServer(self.name)
+        if probe.waitForConnected(200): probe.disconnectFromServer(); return False
+        if not self.server.listen(self.name): QLocalServer.removeServer(self.name); self.server.listen(self.name)
+        return self.server.isListening()
+
+    def accept(self):
+        while self.server.hasPendingConnections():
+            sock = self.server.nextPendingConnection()
+            sock.readyRead.connect(lambda s=sock: self.read(s)); sock.disconnected.connect(sock.deleteLater)
+
+    def read(self, sock):
+        while sock.canReadLine():
+            line = bytes(sock.readLine()).decode("utf-8", "surrogateescape").strip()
+            if line: sock.write((json.dumps(self.execute(line), ensure_ascii=False) + "\n").encode("utf-8", "surrogateescape"))
+
+    def execute(self, line):
+        # Hiçbir istek satırı süreci düşürmemeli: Qt yuvasından kaçan istisna PyQt6'da süreci sonlandırır
+        try: request = json.loads(line) if line[0] in "[{" else parse_command(line)
+        except Exception as e: return {"ok": False, "error": f"geçersiz istek: {e}"}
+        return [self.run(r) for r in request] if isinstance(request, list) else self.run(request)
+
+    def run(self, request):
+        if not isinstance(request, dict) or not isinstance(request.get("cmd"), str): return {"ok": False, "error": "cmd eksik"}
+        try: result = self.handler(request["cmd"], request)
+        except KeyError as e: return {"ok": False, "error": f"eksik alan: {e}"}
+        except Exception as e: return {"ok": False, "error": str(e) or type(e).__name__}
+        return {"ok": True, **(result or {})}
+
+def send_to_running(requests, timeout=500):
+    # Çalışan örnek varsa istekleri ona iletip yanıtı döndürür; yoksa None
+    sock = QLocalSocket(); sock.connectToServer(SERVER_NAME)
+    if not sock.waitForConnected(timeout): return None
+    sock.write((json.dumps(requests, ensure_ascii=False) + "\n").encode("utf-8", "surrogateescape")); sock.waitForBytesWritten(timeout)
+    while not sock.canReadLine() and sock.waitForReadyRead(timeout): pass
+    reply = bytes(sock.readLine()).decode("utf-8", "replace"); sock.disconnectFromServer()
+    try: return json.loads(reply)
+    except ValueError: return []
+
+
+class PlayerEngine(QObject):
+    # Arayüzsüz oynatıcı: QMediaPlayer çifti (kesintisiz geçiş), çalma listesi ve sırası, ses düzeyi, kütüphane ve ayarlar.
+    # Geçerli satır burada tutulur; pencere yalnızca sinyalleri izler ve kullanıcı eylemlerini bu API'ye iletir
+    trackStarted = pyqtSignal(int, str) # satır, yol
+    currentChanged = pyqtSignal(int)
+    positionChanged = pyqtSignal(int)
+    durationChanged = pyqtSignal(int)
+    stateChanged = pyqtSignal()
+    playerChanged = pyqtSignal(object) # kesintisiz geçişte etkin oynatıcı değişti
+    volumeChanged = pyqtSignal(int)
+    modesChanged = pyqtSignal() # karıştırma / tekrar / eşitleme
+    quitRequested = pyqtSignal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.player = self.audio = self.next_player = self.next_audio = None; self.ready = False; self.closed = False
+        self.config = {}; self.view_state = None; self.pending_commands = []; self.validate_after_scan = False; self.removing = False
+        self.current = -1; self.volume = 75; self.shuffle = False; self.repeat = False; self.gapless = True; self.normalize = True
+        self.preload_row = None; self.preload_path = None; self.transition = None; self.timing_log = deque(maxlen=200); self.load_started = None
+        self.playlist = PlaylistModel(self); self.order = PlayOrder(); self.metadata = MetadataCache(META_FILE, self); self.playlist.metadata = self.metadata
+        self.scanner = LibraryScanner(self); self.library = LibraryWatcher(LIBRARY_FILE, self); self.duplicates = DuplicateFinder(self)
+        self.loudness = LoudnessAnalyzer(LOUDNESS_FILE, self); self.validator = PathValidator(self)
+        self.settings = SettingsStore(CONFIG_FILE, self.settings_snapshot, lambda: self.playlist.paths, parent=self)
+        self.validator.missingFound.connect(self.playlist.mark_missing)
+        self.scanner.chunkFound.connect(self.add_to_list); self.scanner.finished.connect(lambda total: self.end_scan())
+        self.library.changed.connect(self.apply_library_changes)
+        self.loudness.gainsReady.connect(lambda gains: self.apply_volume()); self.loudness.finished.connect(lambda count, seconds: self.save())
+        self.playlist.rowsInserted.connect(self.rows_inserted); self.playlist.rowsRemoved.connect(self.rows_removed); self.playlist.modelReset.connect(self.model_reset)
+
+    def load_config(self):
+        data = {}
+        if os.path.exists(CONFIG_FILE):
+            try:
+                with open(CONFIG_FILE, "r", encoding="utf-8") as f: data = json.load(f)
+            except: pass
+        if not isinstance(data, dict): data = {}
+        try:
+            self.volume = max(0, min(100, int(data.get("volume", 75)))); self.gapless = data.get("gapless", True)
+            self.shuffle = data.get("is_shuffled", False); self.repeat = data.get("is_repeated", False)
+            self.normalize = data.get("normalize", True); self.loudness.workers = max(1, int(data.get("loudness_workers", self.loudness.workers)))
+        except: pass
+        self.config = data # görünüme ait anahtarlar da kayıtta korunur; başsız çalışma pencere ayarlarını silmez
+        return data
+
+    def start(self):
+        # Çoklu ortam arka ucu ve kayıtlı liste; pencerede ilk boyamadan sonra, başsızda hemen çağrılır
+        self.player = QMediaPlayer(); self.audio = QAudioOutput(); self.player.setAudioOutput(self.audio)
+        # Kesintisiz çalma: sıradaki parça son saniyelerde ikinci oynatıcıda hazırlanır, bitişte roller değişir
+        self.next_player = QMediaPlayer(); self.next_audio = QAudioOutput(); self.next_player.setAudioOutput(self.next_audio)
+        self.bind_player(self.player, True); self.apply_volume(); self.playerChanged.emit(self.player); self.stateChanged.emit()
+        self.load_playlist(self.config); self.loudness.load(); self.library.start(self.config.get("library_roots", []))
+        if self.config.get("loudness_pending"): self.control_loudness("start") # yarıda kalan analiz sürer
+        for changed in (self.playlist.rowsInserted, self.playlist.rowsRemoved, self.playlist.modelReset): changed.connect(self.settings.mark_playlist_dirty)
+        self.ready = True
+        for cmd, args in self.pending_commands: # açılış sırasında gelen komutlar
+            try: self.command(cmd, args)
+            except Exception as e: print(f"komut uygulanamadı: {cmd}: {e}", file=sys.stderr)
+        self.pending_commands = []
+
+    def close(self):
+        if self.closed: return
+        self.closed = True
+        self.scanner.cancel(); self.library.stop(); self.duplicates.stop(); self.validator.stop(); self.metadata.stop(); self.settings.close(); self.loudness.stop()
+
+    def save(self): self.settings.mark_dirty()
+
+    def settings_snapshot(self):
+        data = dict(self.config)
+        data.update({"volume": self.volume, "is_shuffled": self.shuffle, "is_repeated": self.repeat, "current_index": self.current,
+                     "play_order": self.order.state(), "gapless": self.gapless, "library_roots": list(self.library.roots), "normalize": self.normalize,
+                     "loudness_workers": self.loudness.workers, "loudness_pending": self.loudness.running})
+        if self.view_state is not None: data.update(self.view_state())
+        return data
+
+    def load_playlist(self, data):
+        paths = self.settings.playlists.load()
+        if paths is None: # eski yapılandırmadaki listeyi ayrı depoya taşı
+            paths = [p for p in data.get("playlist", []) if isinstance(p, str)]
+            if paths: self.settings.playlist_changed = True; self.settings.mark_dirty()
+        self.config.pop("playlist", None)
+        self.add_to_list(paths); count = len(self.playlist.paths); self.order.restore(data.get("play_order"), count)
+        if count != len(paths): self.settings.playlist_changed = True; self.settings.mark_dirty() # eski kopyalar atıldı
+        last_idx = data.get("current_index", -1)
+        if isinstance(last_idx, int) and 0 <= last_idx < count: self.set_current(last_idx)
+        self.validator.start(paths)
+
+    # Liste değişince sıra, geçerli satır ve etiket istekleri güncellenir
+    def rows_inserted(self, parent, first, last):
+        self.order.insert(first, last - first + 1); self.metadata.request(self.playlist.paths[first:last + 1])
+        if self.current >= first: self.set_current(self.current + last - first + 1)
+
+    def rows_removed(self, parent, first, last):
+        if not self.removing: self.order.remove(range(first, last + 1)) # remove_rows sırayı tüm aralıklardan sonra bir kez günceller
+        if self.current > last: self.set_current(self.current - (last - first + 1))
+        elif self.current >= first: self.set_current(first - 1) # "sonraki", silinenin yerine geçen satırı çalar
+
+    def model_reset(self): self.order.reset(len(self.playlist.paths)); self.metadata.request(self.playlist.paths); self.set_current(-1)
+
+    def set_current(self, row):
+        if row != self.current: self.current = row; self.currentChanged.emit(row)
+
+    def count(self): return len(self.playlist.paths)
+
+    def current_path(self): return self.player.source().toLocalFile() if self.player is not None else ""
+
+    def playing(self): return self.player is not None and self.player.playbackState() == QMediaPlayer.PlaybackState.PlayingState
+
+    def bind_player(self, player, connect):
+        signals = [(player.positionChanged, self.update_pos), (player.durationChanged, self.update_dur),
+                   (player.playbackStateChanged, self.update_state), (player.mediaStatusChanged, self.handle_media_end)]
+        for source, slot in signals: source.connect(slot) if connect else source.disconnect(slot)
+
+    def update_pos(self, p):
+        td = self.player.duration()
+        if self.load_started is not None and p > 0: PROFILE.record("play_file.load_to_play", self.load_started, "media"); self.load_started = None
+        if self.transition is not None and p > 0: self.log_transition(p)
+        if self.gapless and not self.repeat and self.preload_row is None and td > 0 and td - p < 5000 and self.playlist.paths: self.preload_next()
+        self.positionChanged.emit(p)
+
+    def update_dur(self, d): self.durationChanged.emit(d)
+    def update_state(self, state): self.stateChanged.emit()
+
+    def handle_media_end(self, status):
+        if status == QMediaPlayer.MediaStatus.EndOfMedia:
+            self.transition = (time.perf_counter(), "repeat" if self.repeat else "cold")
+            if self.repeat: self.player.play()
+            elif self.preload_ready(): self.swap_to_preloaded()
+            else: self.next_track()
+
+    def preload_next(self):
+        row = self.order.peek(self.current, self.shuffle); path = self.playlist.path_at(row)
+        self.preload_row = row; self.preload_path = path
+        if path and os.path.exists(path): self.next_player.setSource(QUrl.fromLocalFile(path)); self.apply_volume()
+
+    def preload_ready(self):
+        if self.preload_row is None or not self.playlist.paths: return False
+        row = self.order.peek(self.current, self.shuffle)
+        return row == self.preload_row and self.playlist.path_at(row) == self.preload_path and \
+            self.next_player.mediaStatus() in (QMediaPlayer.MediaStatus.LoadedMedia, QMediaPlayer.MediaStatus.BufferedMedia)
+
+    def clear_preload(self):
+        if self.preload_row is not None: self.next_player.setSource(QUrl())
+        self.preload_row = self.preload_path = None
+
+    def swap_to_preloaded(self):
+        row = self.order.next(self.current, self.shuffle); path = self.preload_path
+        self.next_player.play() # önce başlat, sonra rolleri değiştir
+        old = self.player; self.bind_player(old, False)
+        self.player, self.next_player = self.next_player, old; self.audio, self.next_audio = self.next_audio, self.audio
+        self.bind_player(self.player, True); self.playerChanged.emit(self.player)
+        old.stop(); old.setSource(QUrl()); self.preload_row = self.preload_path = None
+        self.transition = (self.transition[0], "gapless")
+        self.update_dur(self.player.duration()); self.start_track(row, path); self.stateChanged.emit()
+
+    def log_transition(self, p):
+        # Bitişten yeni parçanın ilk konum bildirimine kadar geçen süre, o ana kadar çalınan kısım düşülerek = sessizlik
+        started, mode = self.transition; self.transition = None
+        gap = (time.perf_counter() - started) * 1000 - p
+        self.timing_log.append({"mode": mode, "track": self.current_path(), "gap_ms": round(gap, 2)})
+        if os.environ.get("TURKAMP_TIMING"): print(f"geçiş [{mode}] {gap:.2f} ms", file=sys.stderr)
+
+    def play_file(self, row):
+        path = self.playlist.path_at(row)
+        if path and os.path.exists(path):
+            if PROFILE.enabled: self.load_started = time.perf_counter() # ilk konum bildirimine kadar = yükleme→çalma
+            self.clear_preload(); self.player.setSource(QUrl.fromLocalFile(path)); self.apply_volume(); self.player.play(); self.start_track(row, path)
+
+    def start_track(self, row, path):
+        self.order.visit(row); self.set_current(row); self.trackStarted.emit(row, path); self.save()
+
+    def toggle_play(self):
+        if self.playing(): self.player.pause()
+        elif not self.player.source().isValid() and self.playlist.paths: self.play_file(max(0, self.current))
+        else: self.player.play()
+
+    def play(self):
+        if not self.playing(): self.toggle_play()
+
+    def next_track(self):
+        if self.playlist.paths: self.play_file(self.order.next(self.current, self.shuffle))
+
+    def prev_track(self):
+        if self.playlist.paths: self.play_file(self.order.prev(self.current, self.shuffle))
+
+    def seek(self, ms): self.player.setPosition(max(0, min(self.player.duration(), ms)))
+    def seek_by(self, delta): self.seek(self.player.position() + delta)
+
+    def set_volume(self, v, save=True):
+        v = max(0, min(100, int(v)))
+        if v != self.volume: self.volume = v; self.volumeChanged.emit(v)
+        self.apply_volume()
+        if save: self.save()
+
+    def apply_volume(self):
+        # Düğme değeri × parçanın önceden hesaplanmış kazancı; her oynatıcı kendi parçasının kazancını alır
+        if self.player is None: return
+        self.audio.setVolume(min(1.0, self.volume / 100 * self.track_gain(self.player))); self.next_audio.setVolume(min(1.0, self.volume / 100 * self.track_gain(self.next_player)))
+
+    def track_gain(self, player): return self.loudness.factor(player.source().toLocalFile()) if self.normalize else 1.0
+
+    def set_shuffle(self, on): self.shuffle = on; self.modesChanged.emit(); self.save()
+    def set_repeat(self, on): self.repeat = on; self.modesChanged.emit(); self.save()
+    def set_normalize(self, on): self.normalize = on; self.apply_volume(); self.modesChanged.emit(); self.save()
+
+    def add_to_list(self, paths): self.playlist.insert_paths(paths)
+
+    def remove_rows(self, rows):
+        rows = sorted({r for r in rows if 0 <= r < len(self.playlist.paths)})
+        if not rows: return
+        self.removing = True
+        try: self.playlist.remove_rows(rows)
+        finally: self.removing = False
+        self.order.remove(rows); self.save()
+
+    def clear(self): self.playlist.clear(); self.save()
+
+    def enqueue(self, rows): self.order.enqueue(r for r in rows if r >= 0)
+
+    def scan(self, paths):
+        # Ekleme ve kayıt, tarayıcıdan gelen her parça için model sinyalleri üzerinden yapılır.
+        # İçe aktarılan listelerdeki yolların varlığı tarama bittikten sonra arka planda denetlenir
+        if any(p.lower().endswith(PLAYLIST_FORMATS) for p in paths): self.validate_after_scan = True
+        self.scanner.scan(paths)
+
+    def end_scan(self):
+        if self.scanner.is_running(): return
+        if self.validate_after_scan: self.validate_after_scan = False; self.validator.start(self.playlist.paths)
+
+    def cancel_scan(self): self.scanner.cancel(); self.end_scan()
+
+    def open_paths(self, paths, mode="open"):
+        # Tek dosyalar hemen eklenir ("open": ilki çalınır, "enqueue": sıradaki olur); klasör ve listeler tarayıcıya gider
+        paths = [os.path.abspath(os.path.expanduser(p)) for p in paths]
+        files = [p for p in paths if p.lower().endswith(SUPPORTED_FORMATS) and os.path.isfile(p)]; rest = [p for p in paths if p not in files]
+        if rest: self.scan(rest)
+        if not files: return
+        self.add_to_list(files); rows = {p: i for i, p in enumerate(self.playlist.paths)}
+        if mode == "enqueue": self.order.enqueue(rows[p] for p in files)
+        elif mode == "open": self.play_file(rows[files[0]])
+
+    def add_library_root(self, folder):
+        if self.library.add_root(folder): self.save(); return True
+        return False
+
+    def remove_library_root(self, root): self.library.remove_root(root); self.save()
+
+    def apply_library_changes(self, added, removed, renamed):
+        # İzlenen klasörlerden gelen fark: yeniden adlandırmalar yerinde, silinenler toplu, eklenenler listede yoksa sona
+        if renamed and self.playlist.rename_paths(dict(renamed)):
+            self.settings.mark_playlist_dirty(); self.metadata.request([new for old, new in renamed])
+        gone = {p for p in removed if self.playlist.contains(p)}
+        if gone: self.remove_rows([row for row, path in enumerate(self.playlist.paths) if path in gone])
+        if added: self.add_to_list(added)
+
+    def control_loudness(self, command):
+        if command == "start" and self.playlist.paths: self.loudness.start(self.playlist.paths)
+        elif command == "pause": self.loudness.pause()
+        elif command == "resume": self.loudness.unpause()
+        elif command == "stop": self.loudness.stop()
+        self.save()
+
+    def remove_duplicates(self, groups):
+        # Çalan parça varsa o, yoksa listede ilk sıradaki kopya kalır
+        current = self.current_path(); row_of = {p: i for i, p in enumerate(self.playlist.paths)}; drop = []
+        for group in groups:
+            keep = current if current in group else min(group, key=row_of.__getitem__)
+            drop += [row_of[p] for p in group if p != keep]
+        self.remove_rows(sorted(drop))
+
+    def status(self):
+        path = self.current_path(); info = self.metadata.get(path) or {}
+        state = {QMediaPlayer.PlaybackState.PlayingState: "playing", QMediaPlayer.PlaybackState.PausedState: "paused"}.get(self.player.playbackState(), "stopped")
+        return {"state": state, "path": path, "title": display_name(path, info) if path else "", "artist": info.get("artist"),
+                "position": self.player.position(), "duration": self.player.duration(), "volume": self.volume,
+                "index": self.current, "count": len(self.playlist.paths), "shuffle": self.shuffle, "repeat": self.repeat}
+
+    def command(self, cmd, args):
+        # Yerel soket komutları; çekirdek hazır olmadan gelenler start() sonunda sırayla uygulanır
+        if not self.ready: self.pending_commands.append((cmd, args)); return {"queued": True}
+        if cmd == "status": return self.status()
+        if cmd in ("open", "add", "enqueue"): self.open_paths([str(p) for p in args.get("paths") or []], cmd); return {"count": len(self.playlist.paths)}
+        if cmd == "play": self.play()
+        elif cmd == "pause": self.player.pause()
+        elif cmd == "toggle": self.toggle_play()
+        elif cmd == "stop": self.player.stop()
+        elif cmd == "next": self.next_track()
+        elif cmd == "prev": self.prev_track()
+        elif cmd == "seek": self.seek_by(command_int(args["delta"])) if "delta" in args else self.seek(command_int(args["ms"]))
+        elif cmd == "volume": self.set_volume(command_int(args["value"]))
+        elif cmd == "shuffle": self.set_shuffle(bool(args.get("on", not self.shuffle)))
+        elif cmd == "repeat": self.set_repeat(bool(args.get("on", not self.repeat)))
+        elif cmd == "quit": QTimer.singleShot(0, self.quitRequested.emit) # yanıt gönderildikten sonra
+        else: raise ValueError(f"bilinmeyen komut: {cmd}")
+        return {}
+
+def argument_paths(argv):
+    # Komut satırındaki dosyalar çalışma dizinine göre mutlak yola çevrilir; bulunamayanlar bildirilip atlanır
+    files = []
+    for arg in argv:
+        if arg.startswith("-"): continue
+        if os.path.exists(arg): files.append(os.path.abspath(arg))
+        else: print(f"dosya bulunamadı: {arg}", file=sys.stderr)
+    return files
+
+def quit_on_signals(app):
+    # SIGINT/SIGTERM: Python işleyicisinin Qt olay döngüsünde çalışması için uyandırma soketi; boşta zamanlayıcı tiki yok
+    reader, writer = socket.socketpair(); writer.setblocking(False); signal.set_wakeup_fd(writer.fileno())
+    notifier = QSocketNotifier(reader.fileno(), QSocketNotifier.Type.Read, app); notifier.activated.connect(lambda *args: reader.recv(64))
+    for sig in (signal.SIGINT, signal.SIGTERM): signal.signal(sig, lambda *args: app.quit())
+    app.wakeup = (reader, writer, notifier)
+
+def main():
+    # Başsız çalışma: pencere, stil sayfası ve animasyon yok; numpy ana süreçte yüklenmez. Yerel soket komutlarıyla yönetilir
+    STARTUP.enabled = "--profile-startup" in sys.argv
+    files = argument_paths(sys.argv[1:])
+    if "--new-instance" not in sys.argv:
+        reply = send_to_running([{"cmd": "open", "paths": files}] if files else [{"cmd": "status"}])
+        if reply is not None:
+            if not files: print("TurkaMP zaten çalışıyor", file=sys.stderr)
+            return
+    app = QCoreApplication(PROFILE.configure([a for a in sys.argv if a not in ("--profile-startup", "--new-instance")])); STARTUP.mark("QCoreApplication")
+    engine = PlayerEngine(); engine.load_config(); STARTUP.mark("ayarlar")
+    server = CommandServer(SERVER_NAME, engine.command, engine)
+    if not server.listen(): print(f"komut soketi açılamadı: {SERVER_NAME}", file=sys.stderr)
+    PROFILE.start(engine); engine.start(); STARTUP.mark("çoklu ortam + çalma listesi"); STARTUP.report()
+    if files: engine.command("open", {"paths": files})
+    engine.quitRequested.connect(app.quit); app.aboutToQuit.connect(engine.close); app.aboutToQuit.connect(PROFILE.dump)
+    quit_on_signals(app); sys.exit(app.exec())
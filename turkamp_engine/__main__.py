@@ -0,0 +1,4 @@
+# python3 -m turkamp_engine (başsız). Ana modül ayrı tutulur: spawn ile başlayan işçi süreçleri yalnızca turkamp_worker'ı yükler
+from turkamp_engine import main
+
+main()
@@ -0,0 +1,206 @@
+# TurkaMP işçi süreçleri: kopya parmak izi, ses düzeyi analizi ve dalga biçimi tepeleri. spawn ile başlayan süreçler
+# yalnızca bu modülü içe aktarır, Qt yüklemez (ffmpeg yoksa QAudioDecoder yedeği ihtiyaç anında yüklenir)
+import os
+import math
+import time
+import queue
+import struct
+import shutil
+import hashlib
+import subprocess
+np = None # gerektiğinde load_numpy() ile yüklenir
+
+def load_numpy():
+    # Ana süreçte çekirdek üzerinden ertelenerek, işçide ilk işte yüklenir; numpy yoksa None
+    global np
+    if np is None:
+        try: import numpy; np = numpy
+        except ImportError: np = False
+    return np or None
+
+def syncsafe(data): return (data[0] << 21) | (data[1] << 14) | (data[2] << 7) | data[3]
+
+def audio_span(path):
+    # (yol, ses bölgesi başlangıcı, uzunluğu): MP3'te ID3v2 başlığı ve ID3v1 kuyruğu dışarıda kalır, etiketi farklı kopyalar eşleşir
+    try:
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size; start = 0; end = size
+            if path.lower().endswith((".mp3", ".mpga")):
+                head = f.read(10)
+                if len(head) == 10 and head[:3] == b"ID3": start = 10 + syncsafe(head[6:10]) + (10 if head[5] & 0x10 else 0)
+                if size >= 128: f.seek(size - 128); end -= 128 if f.read(3) == b"TAG" else 0
+            return path, start, max(0, end - start)
+    except OSError: return path, 0, -1
+
+def sampled_hash(job, samples=8, block=64 * 1024):
+    # Ses bölgesine eşit aralıklı birkaç blok + uzunluk; tüm dosya okunmaz
+    path, start, length = job; digest = hashlib.blake2b(str(length).encode(), digest_size=16)
+    try:
+        with open(path, "rb") as f:
+            if length <= block * samples: f.seek(start); digest.update(f.read(length)); return path, digest.hexdigest()
+            for i in range(samples): # ilk ve son blok dahil
+                f.seek(start + (length - block) * i // (samples - 1)); digest.update(f.read(block))
+    except OSError: return path, None
+    return path, digest.hexdigest()
+
+K_WEIGHTING = (((1.53512485958697, -2.69169618940638, 1.19839281085285), (1.0, -1.69065929318241, 0.73248077421585)), # BS.1770, 48 kHz
+               ((1.0, -2.0, 1.0), (1.0, -1.99004745483398, 0.99007225036621)))
+
+class LoudnessMeter:
+    # EBU R128 / BS.1770 tümleşik ses yüksekliği. K ağırlıklı 100 ms dilim güçleri, dilimlerin rfft'si üzerinden (Parseval)
+    # tek vektör işlemiyle bulunur; 400 ms bloklar (%75 örtüşme) -70 LUFS mutlak ve -10 LU göreli kapıdan geçer
+    def __init__(self): self.rate = 0; self.tail = None; self.powers = []; self.peak = 0.0
+
+    def set_rate(self, rate, channels):
+        self.rate = rate; self.segment = n = max(1, rate // 10); self.tail = np.zeros((0, channels), np.float32)
+        freqs = np.minimum(np.fft.rfftfreq(n, 1 / rate), 23999.0); z = np.exp(-2j * np.pi * freqs / 48000)
+        response = np.ones_like(z)
+        for b, a in K_WEIGHTING: response *= (b[0] + b[1] * z + b[2] * z * z) / (a[0] + a[1] * z + a[2] * z * z)
+        fold = np.full(freqs.size, 2.0); fold[0] = 1.0
+        if n % 2 == 0: fold[-1] = 1.0
+        self.weights = np.abs(response) ** 2 * fold / (n * n)
+
+    def feed(self, samples, rate):
+        if self.tail is None or rate != self.rate or samples.shape[1] != self.tail.shape[1]: self.set_rate(rate, samples.shape[1])
+        if samples.size: self.peak = max(self.peak, float(np.abs(samples).max()))
+        data = np.concatenate([self.tail, samples]); count = data.shape[0] // self.segment
+        if count:
+            spec = np.fft.rfft(data[:count * self.segment].reshape(count, self.segment, -1), axis=1)
+            self.powers.extend(((spec.real ** 2 + spec.imag ** 2) * self.weights[:, None]).sum(axis=(1, 2)).tolist())
+        self.tail = data[count * self.segment:]
+
+    def loudness(self):
+        if len(self.powers) < 4: return None
+        blocks = np.convolve(np.asarray(self.powers), np.full(4, 0.25), mode="valid")
+        blocks = blocks[blocks > 10 ** ((-70 + 0.691) / 10)]
+        if not blocks.size: return None # sessizlik
+        blocks = blocks[blocks > blocks.mean() * 0.1]
+        return -0.691 + 10 * math.log10(blocks.mean())
+
+DECODER_APP = None
+
+def decode_audio(path, sink, rate=48000):
+    # ffmpeg varsa 48 kHz stereo float akışı; yoksa Qt'nin QAudioDecoder'ı (çözücünün verdiği biçimde). sink False dönerse çözme kesilir
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg:
+        command = [ffmpeg, "-v", "quiet", "-nostdin", "-i", path, "-vn", "-f", "f32le", "-ac", "2", "-ar", str(rate), "-"]
+        with subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL) as proc:
+            rest = b""
+            while True:
+                data = proc.stdout.read(1 << 20)
+                if not data: break
+                data = rest + data; usable = len(data) - len(data) % 8; rest = data[usable:]
+                if sink(np.frombuffer(data[:usable], np.float32).reshape(-1, 2), rate) is False: proc.kill(); return False
+        return proc.returncode == 0
+    # Qt yedeği yalnızca burada yüklenir; PCM dönüştürücü ve onun numpy'si çekirdekten
+    global DECODER_APP
+    from PyQt6.QtCore import QCoreApplication, QEventLoop, QUrl
+    from PyQt6.QtMultimedia import QAudioDecoder, QAudioFormat
+    import turkamp_engine; turkamp_engine.load_numpy(); buffer_samples = turkamp_engine.buffer_samples
+    if QCoreApplication.instance() is None: DECODER_APP = QCoreApplication([]) # QAudioDecoder canlı bir uygulama nesnesi ister; süreç boyunca tutulur
+    loop = QEventLoop(); failed = []
+    decoder = QAudioDecoder(); fmt = QAudioFormat(); fmt.setSampleRate(rate); fmt.setChannelCount(2); fmt.setSampleFormat(QAudioFormat.SampleFormat.Float)
+    decoder.setAudioFormat(fmt); decoder.setSource(QUrl.fromLocalFile(path))
+    def ready():
+        while decoder.bufferAvailable() and not failed:
+            pcm = buffer_samples(decoder.read())
+            if pcm is not None and sink(*pcm) is False: failed.append(True); decoder.stop(); loop.quit()
+    decoder.bufferReady.connect(ready); decoder.finished.connect(loop.quit)
+    decoder.error.connect(lambda *args: (failed.append(True), loop.quit()))
+    decoder.start(); loop.exec(); ready()
+    return not failed
+
+def measure_loudness(path):
+    # Süreç havuzunda çalışır: (yol, LUFS ya da None, tepe)
+    if not load_numpy(): return path, None, 0.0
+    meter = LoudnessMeter()
+    try: ok = decode_audio(path, meter.feed)
+    except (OSError, ValueError): ok = False
+    return path, meter.loudness() if ok else None, meter.peak
+
+def lower_priority():
+    try: os.nice(10) # analiz, çalmayla yarışmasın
+    except OSError: pass
+
+PEAK_MAGIC = b"TKPK"
+PEAK_BUCKET = 1024 # en ince düzeyde kova başına kare (48 kHz'de ~21 ms)
+PEAK_FACTORS = (1, 8, 64) # düzeyler: ince → kaba
+PEAK_CACHE_LIMIT = 512 << 20
+
+def quantize_peaks(values): return np.clip(np.round(values * 127), -127, 127).astype(np.int8)
+
+class PeakBuilder:
+    # Çözülen PCM'den en ince düzeyin min/max kovaları (int8); kaba düzeyler dosyaya yazarken indirgenir
+    def __init__(self): self.rate = 0; self.tail = None; self.lo = bytearray(); self.hi = bytearray(); self.sent = 0
+
+    def feed(self, samples, rate):
+        if self.tail is None or rate != self.rate or samples.shape[1] != self.tail.shape[1]:
+            self.rate = rate; self.tail = np.zeros((0, samples.shape[1]), np.float32)
+        data = np.concatenate([self.tail, samples]); count = data.shape[0] // PEAK_BUCKET
+        if count:
+            block = data[:count * PEAK_BUCKET].reshape(count, -1)
+            self.lo += quantize_peaks(block.min(axis=1)).tobytes(); self.hi += quantize_peaks(block.max(axis=1)).tobytes()
+        self.tail = data[count * PEAK_BUCKET:]
+
+    def finish(self):
+        if self.tail is not None and self.tail.size:
+            self.lo += quantize_peaks(self.tail.min(keepdims=True)).tobytes(); self.hi += quantize_peaks(self.tail.max(keepdims=True)).tobytes()
+            self.tail = self.tail[:0]
+
+    def preview(self):
+        # İlerleyen çizim için henüz gönderilmemiş ikinci düzey kovalar
+        factor = PEAK_FACTORS[1]; full = len(self.lo) // factor
+        if full <= self.sent: return None
+        span = (full - self.sent) * factor; offset = self.sent * factor; self.sent = full
+        return np.stack([np.frombuffer(self.lo, np.int8, span, offset).reshape(-1, factor).min(axis=1),
+                         np.frombuffer(self.hi, np.int8, span, offset).reshape(-1, factor).max(axis=1)], axis=1)
+
+    def write(self, target):
+        lo = np.frombuffer(bytes(self.lo), np.int8); hi = np.frombuffer(bytes(self.hi), np.int8)
+        if not lo.size or not self.rate: return False
+        header = [struct.pack("<4sIII", PEAK_MAGIC, self.rate, PEAK_BUCKET, len(PEAK_FACTORS))]; body = []
+        for factor in PEAK_FACTORS:
+            starts = np.arange(0, lo.size, factor)
+            pairs = np.stack([np.minimum.reduceat(lo, starts), np.maximum.reduceat(hi, starts)], axis=1)
+            header.append(struct.pack("<II", factor, len(pairs))); body.append(pairs.tobytes())
+        tmp = target + ".tmp"
+        try:
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            with open(tmp, "wb") as f: f.write(b"".join(header + body))
+            os.replace(tmp, target); return True
+        except OSError: return False
+
+def prune_peaks(folder, limit=PEAK_CACHE_LIMIT):
+    # En uzun süredir açılmayan dosyalar silinerek önbellek sınırın altında tutulur (yükleme mtime'ı tazeler)
+    try:
+        with os.scandir(folder) as it: entries = sorted((e.stat().st_mtime, e.stat().st_size, e.path) for e in it if e.name.endswith(".peaks"))
+    except OSError: return
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in entries:
+        if total <= limit: break
+        try: os.remove(path); total -= size
+        except OSError: pass
+
+def peak_worker(jobs, results, cancel, folder):
+    # Ayrı süreç: her zaman kuyruktaki en yeni isteği çözer; yeni istek gelince eldeki iptal edilir
+    if not load_numpy(): return
+    prune_peaks(folder)
+    while True:
+        job = jobs.get()
+        while job is not None:
+            try: job = jobs.get_nowait()
+            except queue.Empty: break
+        if job is None: return
+        path, target = job; cancel.clear(); builder = PeakBuilder(); last = [time.monotonic()]
+        def sink(samples, rate):
+            if cancel.is_set(): return False
+            builder.feed(samples, rate); now = time.monotonic()
+            if now - last[0] > 0.25:
+                part = builder.preview(); last[0] = now
+                if part is not None: results.put(("part", path, builder.rate, part))
+        try:
+            ok = decode_audio(path, sink)
+            if ok and not cancel.is_set(): builder.finish(); ok = builder.write(target)
+        except Exception: ok = False # çözücü ya da PeakBuilder hatası işçiyi düşürmez; iş başarısız sayılır
+        if cancel.is_set(): continue
+        results.put(("done", path, target) if ok else ("failed", path, None))